@@ -1,4 +1,7 @@
 """Import main classes upon package import"""
-from .card import Card
+from .card import Card, rebuild_tables
 from .view import View
-from .deck import Deck
+from .deck import Deck, clear_spec_cache
+from .compact import CompactDeck, ShoeBatch
+from .ansi import enable_terminal
+from .backends import set_default_backend
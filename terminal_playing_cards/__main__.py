@@ -1,13 +1,14 @@
 """Showcase how cards look in the terminal"""
 
-from terminal_playing_cards import Deck, View
+from terminal_playing_cards import Deck, enable_terminal
 
 MY_DECK = Deck()
 
 MY_DECK.sort(sort_order=["suit"])
 
-SUITED_VIEWS = [View([MY_DECK.pop() for _ in range(13)], spacing=-5) for _ in range(4)]
+SUITED_VIEWS = [MY_DECK.deal(13, spacing=-5) for _ in range(4)]
 
 if __name__ == "__main__":
+    enable_terminal()
     for suit_view in SUITED_VIEWS:
         print(suit_view)
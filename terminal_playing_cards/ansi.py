@@ -0,0 +1,135 @@
+"""ANSI escape codes for styling cards in the terminal"""
+# These are the same escape codes as colorama's Fore, Back and Style. They are
+# defined here so that importing the package does not import colorama, which
+# is only needed once something is printed. See enable_terminal()
+# pylint: disable=too-few-public-methods
+
+import re
+from functools import lru_cache
+
+
+def _sgr(code: int) -> str:
+    """Builds the Select Graphic Rendition escape sequence for a code."""
+    return f"\x1b[{code}m"
+
+
+class Fore:
+    BLACK = _sgr(30)
+    RED = _sgr(31)
+    GREEN = _sgr(32)
+    YELLOW = _sgr(33)
+    BLUE = _sgr(34)
+    MAGENTA = _sgr(35)
+    CYAN = _sgr(36)
+    WHITE = _sgr(37)
+    RESET = _sgr(39)
+    LIGHTBLACK_EX = _sgr(90)
+    LIGHTRED_EX = _sgr(91)
+    LIGHTGREEN_EX = _sgr(92)
+    LIGHTYELLOW_EX = _sgr(93)
+    LIGHTBLUE_EX = _sgr(94)
+    LIGHTMAGENTA_EX = _sgr(95)
+    LIGHTCYAN_EX = _sgr(96)
+    LIGHTWHITE_EX = _sgr(97)
+
+
+class Back:
+    BLACK = _sgr(40)
+    RED = _sgr(41)
+    GREEN = _sgr(42)
+    YELLOW = _sgr(43)
+    BLUE = _sgr(44)
+    MAGENTA = _sgr(45)
+    CYAN = _sgr(46)
+    WHITE = _sgr(47)
+    RESET = _sgr(49)
+    LIGHTBLACK_EX = _sgr(100)
+    LIGHTRED_EX = _sgr(101)
+    LIGHTGREEN_EX = _sgr(102)
+    LIGHTYELLOW_EX = _sgr(103)
+    LIGHTBLUE_EX = _sgr(104)
+    LIGHTMAGENTA_EX = _sgr(105)
+    LIGHTCYAN_EX = _sgr(106)
+    LIGHTWHITE_EX = _sgr(107)
+
+
+class Style:
+    BRIGHT = _sgr(1)
+    DIM = _sgr(2)
+    NORMAL = _sgr(22)
+    RESET_ALL = _sgr(0)
+
+
+# Terminal style as (foreground, background, intensity) SGR codes, where
+# None means the terminal default
+DEFAULT_STATE = (None, None, None)
+_SGR_PATTERN = re.compile("\x1b\\[([0-9;]*)m")
+
+
+@lru_cache(maxsize=1024)
+def apply_sgr(state: tuple, escape: str) -> tuple:
+    """Works out the terminal style after writing the escape codes."""
+    foreground, background, intensity = state
+    for params in _SGR_PATTERN.findall(escape):
+        for param in params.split(";"):
+            code = int(param) if param else 0
+            if code == 0:
+                foreground, background, intensity = DEFAULT_STATE
+            elif code in (1, 2):
+                intensity = code
+            elif code == 22:
+                intensity = None
+            elif code == 39:
+                foreground = None
+            elif code == 49:
+                background = None
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                foreground = code
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                background = code
+    return (foreground, background, intensity)
+
+
+@lru_cache(maxsize=1024)
+def sgr_delta(state: tuple, new_state: tuple) -> str:
+    """Builds the shortest escape that changes the terminal style.
+
+    Only the attributes that differ are set, all in a single escape
+    sequence. Returns an empty string when the style does not change.
+    """
+    if new_state == state:
+        return ""
+    # Codes that put each attribute back to the terminal default
+    default_codes = (39, 49, 22)
+    changes = [
+        default_code if new_code is None else new_code
+        for old_code, new_code, default_code in zip(state, new_state, default_codes)
+        if old_code != new_code
+    ]
+    # Resetting everything and setting what is left can be shorter
+    from_reset = [0] + [code for code in new_state if code is not None]
+    codes = min(changes, from_reset, key=lambda codes: len(";".join(map(str, codes))))
+    return "\x1b[" + ";".join(map(str, codes)) + "m"
+
+
+_TERMINAL_ENABLED = False
+
+
+def enable_terminal() -> None:
+    """Prepares the terminal for printing cards.
+
+    Initializes colorama, which wraps sys.stdout to change the color back
+    to default after each print. This prevents user input from being
+    colored, and translates the escape codes on Windows consoles. Happens
+    automatically the first time a Card or View is printed, so only call
+    this to set up the terminal ahead of time.
+    """
+    # pylint: disable=global-statement
+    global _TERMINAL_ENABLED
+    if _TERMINAL_ENABLED:
+        return
+    # pylint: disable=import-outside-toplevel
+    from colorama import init
+
+    init(autoreset=True)
+    _TERMINAL_ENABLED = True
@@ -0,0 +1,109 @@
+"""Output backends that turn rendered cards into text"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+from typing import Iterable, Union
+from terminal_playing_cards.ansi import DEFAULT_STATE, Style, apply_sgr, sgr_delta
+
+
+class AnsiBackend(object):
+    """Renders cards with ANSI escape codes for color terminals.
+
+    A backend turns the output of the renderers into text. Cards and
+    Views describe each terminal line as a sequence of (escape, text)
+    segments, where escape is the ANSI style applied before the text.
+    Custom backends can subclass this class and be passed wherever a
+    backend name is accepted.
+    """
+
+    # Whether the output needs a terminal that understands escape codes
+    uses_ansi = True
+
+    def merge(self, segments: Iterable[tuple]) -> str:
+        """Builds one terminal line from its (escape, text) segments."""
+        return "".join(escape + text for escape, text in segments)
+
+    def card(self, style: str, layers: Iterable[str]) -> str:
+        """Builds a single Card from its style and layer strings.
+
+        Cards end in the default style, just like lines of a View.
+        """
+        return style + "".join("\n" + layer for layer in layers) + Style.RESET_ALL
+
+
+class PlainBackend(AnsiBackend):
+    """Renders cards as plain text, without any escape codes."""
+
+    uses_ansi = False
+
+    def merge(self, segments: Iterable[tuple]) -> str:
+        return "".join(text for _, text in segments)
+
+    def card(self, style: str, layers: Iterable[str]) -> str:
+        return "".join("\n" + layer for layer in layers)
+
+
+class MinimalAnsiBackend(AnsiBackend):
+    """Renders cards with as few ANSI escape codes as possible.
+
+    Keeps track of the terminal style along the line and only writes the
+    attributes that actually change, combined into one escape sequence.
+    A style change is held back until there is text to write in it, so
+    runs of segments in the same style share one escape. For example,
+    neighboring cards of the same color in an overlapping View need no
+    escape between them at all. Lines always end in the default style.
+    """
+
+    def merge(self, segments: Iterable[tuple]) -> str:
+        line = []
+        written_state = DEFAULT_STATE
+        state = DEFAULT_STATE
+        for escape, text in segments:
+            state = apply_sgr(state, escape)
+            if text:
+                line.append(sgr_delta(written_state, state))
+                written_state = state
+                line.append(text)
+        line.append(sgr_delta(written_state, DEFAULT_STATE))
+        return "".join(line)
+
+    def card(self, style: str, layers: Iterable[str]) -> str:
+        state = apply_sgr(DEFAULT_STATE, style)
+        return (
+            sgr_delta(DEFAULT_STATE, state)
+            + "".join("\n" + layer for layer in layers)
+            + sgr_delta(state, DEFAULT_STATE)
+        )
+
+
+BACKENDS = {
+    "ansi": AnsiBackend(),
+    "plain": PlainBackend(),
+    "minimal": MinimalAnsiBackend(),
+}
+
+_DEFAULT_BACKEND = {"name": "ansi"}
+
+
+def set_default_backend(backend: str) -> None:
+    """Chooses the backend used when printing Cards and Views.
+
+    Args:
+        backend: Name of a backend in BACKENDS. Available options
+            are ansi, plain and minimal. Defaults to ansi.
+    """
+    get_backend(backend)
+    _DEFAULT_BACKEND["name"] = backend
+
+
+def get_backend(backend: Union[str, AnsiBackend] = None) -> AnsiBackend:
+    """Looks up a backend by name, falling back to the default backend."""
+    if backend is None:
+        backend = _DEFAULT_BACKEND["name"]
+    if not isinstance(backend, str):
+        return backend
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise NotImplementedError(f"There is no '{backend}' rendering backend")
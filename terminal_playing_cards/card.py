@@ -3,7 +3,10 @@
 # pylint: disable=missing-docstring
 # pylint: disable=bad-continuation
 from functools import total_ordering
-from colorama import init
+from sys import intern
+from typing import Union
+from terminal_playing_cards.ansi import Style, enable_terminal
+from terminal_playing_cards.backends import AnsiBackend, get_backend
 from terminal_playing_cards.utils import convert_layers_to_string
 from terminal_playing_cards.config import (
     SUIT_SYMBOL_DICT,
@@ -11,9 +14,17 @@ from terminal_playing_cards.config import (
     CARD_BACK_STYLE,
 )
 
-# Change the color back to default after each print
-# Prevents user input from being colored
-init(autoreset=True)
+# Finished renders shared by every Card, keyed on everything that changes
+# how a card looks: (face, suit, hidden, picture). Filled lazily, or all at
+# once by rebuild_tables(). Bounded so that cards with custom faces/suits
+# cannot grow it without limit.
+RENDER_CACHE_SIZE = 1024
+_RENDER_CACHE = {}
+
+
+def clear_render_cache() -> None:
+    """Forget all cached Card renders, e.g. after editing the config dicts."""
+    _RENDER_CACHE.clear()
 
 
 @total_ordering
@@ -43,26 +54,56 @@ class Card(object):
             in help(Deck) for further information.
     """
 
+    # Millions of Cards may be alive at once, so skip the per-instance dict
+    __slots__ = ("_face", "_suit", "value", "hidden", "picture")
+
     def __init__(self, face: str, suit: str, value: int = 0, **kwargs: bool):
-        self._face = None
         self.face = face
-        self._suit = None
         self.suit = suit
         self.value = value
         self.hidden = kwargs.get("hidden", False)
         self.picture = kwargs.get("picture", True)
 
+    @classmethod
+    def _from_valid(
+        cls, face: str, suit: str, value: int, hidden: bool, picture: bool
+    ) -> "Card":
+        """Creates a Card from a face and suit that were already validated.
+
+        Skips the face and suit checks, so callers must pass values
+        returned by _valid_face and _valid_suit.
+        """
+        card = cls.__new__(cls)
+        card._face = face
+        card._suit = suit
+        card.value = value
+        card.hidden = hidden
+        card.picture = picture
+        return card
+
+    @staticmethod
+    def _valid_face(value: str) -> str:
+        """Converts a face to its shared canonical string, if it is valid."""
+        value = value.upper()
+        if value in CARD_FACE_DICT:
+            return intern(value)
+        raise NotImplementedError(f"'{value}' is not a valid face for a Card")
+
+    @staticmethod
+    def _valid_suit(value: str) -> str:
+        """Converts a suit to its shared canonical string, if it is valid."""
+        value = value.lower()
+        if value in SUIT_SYMBOL_DICT:
+            return intern(value)
+        raise NotImplementedError(f"'{value}' is not a valid suit for a Card")
+
     @property
     def face(self):
         return self._face
 
     @face.setter
     def face(self, value):
-        value = value.upper()
-        if value in CARD_FACE_DICT.keys():
-            self._face = value
-        else:
-            raise NotImplementedError(f"'{value}' is not a valid face for a Card")
+        self._face = self._valid_face(value)
 
     @property
     def suit(self):
@@ -70,11 +111,7 @@ class Card(object):
 
     @suit.setter
     def suit(self, value):
-        value = value.lower()
-        if value in SUIT_SYMBOL_DICT.keys():
-            self._suit = value
-        else:
-            raise NotImplementedError(f"'{value}' is not a valid suit for a Card")
+        self._suit = self._valid_suit(value)
 
     def _create_card_grid(self) -> list:
         """Creates a standard empty grid template for all playing cards."""
@@ -131,19 +168,75 @@ class Card(object):
         return card_grid
 
     def _get_style(self) -> str:
-        """Retrives the colorama codes for a card style."""
+        """Retrives the ANSI codes for a card style."""
         return (
             SUIT_SYMBOL_DICT.get(self.suit).get("style")
             if not self.hidden
             else CARD_BACK_STYLE
         )
 
+    def _render(self) -> tuple:
+        """Retrieves the finished (layers, string, prefixes) render of the card.
+
+        Renders are cached across all Cards. The layers are returned as
+        tuples so the shared cache entry cannot be modified by callers.
+        prefixes holds, for every layer, the string of its first n cells
+        at index n, so a partly covered card is drawn without touching
+        individual cells.
+        """
+        # Every hidden card looks the same, whatever its face and suit
+        key = (
+            (None, None, True, self.picture)
+            if self.hidden
+            else (self._face, self._suit, False, self.picture)
+        )
+        try:
+            return _RENDER_CACHE[key]
+        except KeyError:
+            pass
+
+        layers = tuple(tuple(layer) for layer in self._plan_card_grid())
+        prefixes = tuple(
+            tuple("".join(layer[:n_cells]) for n_cells in range(len(layer) + 1))
+            for layer in layers
+        )
+        # End in the default style, so that whatever is printed after the
+        # card is not colored, even before the terminal is set up
+        rendered = (
+            layers,
+            self._get_style() + convert_layers_to_string(layers) + Style.RESET_ALL,
+            prefixes,
+        )
+        if len(_RENDER_CACHE) >= RENDER_CACHE_SIZE:
+            # Evict the oldest entry, dicts remember insertion order
+            del _RENDER_CACHE[next(iter(_RENDER_CACHE))]
+        _RENDER_CACHE[key] = rendered
+        return rendered
+
+    def render(self, backend: Union[str, AnsiBackend] = None) -> str:
+        """Renders the card as a string with the given backend.
+
+        Args:
+            backend: How to turn the card into text. Available options
+                are ansi, plain and minimal. See
+                terminal_playing_cards.backends for details. Defaults
+                to ansi.
+
+        Returns:
+            The card as text, just like str(card) but for the backend.
+        """
+        backend = get_backend(backend)
+        if backend.uses_ansi:
+            enable_terminal()
+        # The default output is cached in full
+        if type(backend).card is AnsiBackend.card:
+            return self._render()[1]
+        layers = (prefixes[-1] for prefixes in self._render()[2])
+        return backend.card(self._get_style(), layers)
+
     def __str__(self):
         """Makes the card look like an actual playing card."""
-        card_grid_plan = self._plan_card_grid()
-        card_str = convert_layers_to_string(card_grid_plan)
-
-        return self._get_style() + card_str
+        return self.render()
 
     def __repr__(self):
         return (
@@ -152,7 +245,11 @@ class Card(object):
         )
 
     def __getitem__(self, key):
-        return self._plan_card_grid()[key]
+        layers = self._render()[0][key]
+        # Hand out copies so the shared cached render stays untouched
+        if isinstance(key, slice):
+            return [list(layer) for layer in layers]
+        return list(layers)
 
     # All magic methods are designed to work for comparing cards against
     # other Card objects or numbers
@@ -197,3 +294,20 @@ class Card(object):
         except AttributeError:
             result = other - self.value
         return result
+
+
+def rebuild_tables() -> None:
+    """Renders every Card described by the config dicts ahead of time.
+
+    Cards are otherwise rendered on first use. Faces and suits added to
+    CARD_FACE_DICT or SUIT_SYMBOL_DICT are picked up automatically, but
+    call this after changing an existing face or suit so that Cards stop
+    using their old look.
+    """
+    clear_render_cache()
+    # pylint: disable=protected-access
+    for face in CARD_FACE_DICT:
+        for suit in SUIT_SYMBOL_DICT:
+            for hidden in [False, True]:
+                for picture in [True, False]:
+                    Card(face, suit, hidden=hidden, picture=picture)._render()
@@ -0,0 +1,341 @@
+"""Create a memory efficient deck of playing cards stored as integer codes"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+import random
+import threading
+from array import array
+from copy import copy
+from typing import Union
+from terminal_playing_cards.card import Card
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.utils import get_rng
+
+
+class CardTable(object):
+    """Integer encoding of every Card a Deck specification can build.
+
+    Each face and suit pair in the specification is given a code, in the
+    order the Deck would build it. For the default specification this
+    means the ace of clubs is 0, the ace of diamonds is 1, and so on up to
+    the king of hearts at 51.
+
+    Attributes:
+        spec_dict: A dictionary of Deck build specifications.
+            See terminal_playing_cards.config.DEFAULT_DECK_SPEC
+            for an example.
+    """
+
+    def __init__(self, spec_dict: dict):
+        entries = [
+            (face, suit, value)
+            for face, suits in spec_dict.items()
+            for suit, value in suits.items()
+        ]
+        if len(entries) > 256:
+            raise NotImplementedError(
+                "A CardTable cannot encode more than 256 different Cards"
+            )
+        # One read-only Card per code, used to compute sort keys
+        self.cards = tuple(
+            Card(face, suit, value=value) for face, suit, value in entries
+        )
+        self.faces = tuple(card.face for card in self.cards)
+        self.suits = tuple(card.suit for card in self.cards)
+        # Value lookup table, indexed by card code
+        self.values = tuple(card.value for card in self.cards)
+        self._codes = {
+            (card.face, card.suit): code for code, card in enumerate(self.cards)
+        }
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __eq__(self, other):
+        return isinstance(other, CardTable) and (
+            (self.faces, self.suits, self.values)
+            == (other.faces, other.suits, other.values)
+        )
+
+    def __hash__(self):
+        return hash((self.faces, self.suits, self.values))
+
+    def encode(self, card: Card) -> int:
+        """Looks up the code of a Card by its face and suit."""
+        try:
+            return self._codes[(card.face, card.suit)]
+        except KeyError:
+            raise NotImplementedError(
+                f"{card!r} is not part of this deck's specifications"
+            )
+
+    def decode(self, code: int, **kwargs: bool) -> Card:
+        """Builds a new Card object for a code."""
+        # The faces and suits were validated when the table was built
+        # pylint: disable=protected-access
+        return Card._from_valid(
+            self.faces[code],
+            self.suits[code],
+            self.values[code],
+            kwargs.get("hidden", False),
+            kwargs.get("picture", True),
+        )
+
+
+class CompactDeck(Deck):
+    """A Deck that stores its Cards as small integer codes.
+
+    Holds one byte per card in an array instead of one Card object per
+    card, which makes it cheap to keep millions of decks in memory. Card
+    objects are only built when a card is indexed, iterated over or popped.
+    Otherwise it works just like a Deck. For example:
+
+    from terminal_playing_cards import CompactDeck
+
+    deck = CompactDeck(specifications=["face_cards_are_ten"])
+    deck.shuffle()
+    top_card = deck.pop()
+
+    Since cards are stored by face and suit alone, Cards added to a
+    CompactDeck take the value and display options of the deck.
+
+    Attributes:
+        specifications: A list of intialization options or a custom
+            dictionary detailing exactly how the deck should be built.
+            See help(Deck) for further information.
+        rng: A seed or random.Random instance the deck is shuffled with.
+            See help(Deck) for further information.
+        n_decks: Number of copies of the deck to stack into a shoe.
+            Defaults to 1. Unlike a Deck, a CompactDeck does not keep
+            track of which deck each card came from.
+        kwargs: Card initialization options. See kwargs in help(Deck)
+            for further information.
+        table: The CardTable used to encode and decode the cards.
+        codes: An array of card codes, one byte per card.
+    """
+
+    # The cards are stored as codes rather than a list of Cards
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self,
+        specifications: Union[list, dict] = None,
+        rng: Union[int, random.Random] = None,
+        n_decks: int = 1,
+        **kwargs: bool,
+    ):
+        spec_dict = self._get_spec_dict(specifications)
+        self.table = CardTable(spec_dict)
+        self.codes = array("B", range(len(self.table))) * n_decks
+        # Keep None rather than the random module, which cannot be pickled
+        self.rng = get_rng(rng) if rng is not None else None
+        self._card_options = kwargs
+        self._lock = threading.Lock()
+
+    # pylint: enable=super-init-not-called
+
+    @property
+    def cards(self) -> list:
+        """A new list of Card objects for the codes in the deck."""
+        return [self.table.decode(code, **self._card_options) for code in self.codes]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [
+                self.table.decode(code, **self._card_options)
+                for code in self.codes[key]
+            ]
+        return self.table.decode(self.codes[key], **self._card_options)
+
+    def __iter__(self):
+        for code in self.codes:
+            yield self.table.decode(code, **self._card_options)
+
+    @classmethod
+    def concat(cls, *decks) -> "CompactDeck":
+        """Stacks CompactDecks, Decks, Views or lists of Cards into a new one.
+
+        The first deck must be a CompactDeck, the others are encoded
+        with its CardTable.
+        """
+        combined = copy(decks[0])
+        combined.codes = array("B", decks[0].codes)
+        for deck in decks[1:]:
+            combined += deck
+        return combined
+
+    def __add__(self, other):
+        """Add a Deck, View or Cards to this CompactDeck, making a new one"""
+        return self.concat(self, other)
+
+    def __iadd__(self, other):
+        """Add a Deck, View or Cards to this CompactDeck"""
+        if isinstance(other, CompactDeck) and other.table == self.table:
+            self.codes += other.codes
+            return self
+
+        other_cards = self._cards_of(other)
+        self.codes += array("B", [self.table.encode(card) for card in other_cards])
+        return self
+
+    def pop(self, index: int = 0) -> Card:
+        """Pops a card out of the deck.
+
+        Works just like Deck.pop(), building the Card from its code.
+
+        Args:
+            index: The index in the deck at which to pop
+                out a Card. Defaults to 0
+
+        Returns:
+            A Card object
+        """
+        return self.table.decode(self.codes.pop(index), **self._card_options)
+
+    def _take_top(self, n_cards: int) -> list:
+        """Removes the top cards of the deck and returns them as Cards."""
+        top_codes = self.codes[:n_cards]
+        del self.codes[:n_cards]
+        return [self.table.decode(code, **self._card_options) for code in top_codes]
+
+    def _sort_cards(self, key) -> None:
+        """Sorts the codes in place with a key function of one Card."""
+        cards = self.table.cards
+        self.codes = array("B", sorted(self.codes, key=lambda code: key(cards[code])))
+
+    def shuffle(self, rng: Union[int, random.Random] = None) -> None:
+        """Shuffles the cards in place.
+
+        Args:
+            rng: A seed or random.Random instance to shuffle with
+                this time. Defaults to the generator the deck was
+                created with.
+        """
+        codes = self.codes.tolist()
+        get_rng(rng if rng is not None else self.rng).shuffle(codes)
+        self.codes = array("B", codes)
+
+
+class ShoeBatch(object):
+    """Many shuffled decks stored as rows of one array of card codes.
+
+    Deals hands as slices of card codes, without building any Card
+    objects. Designed for simulations that play through a large number of
+    decks. Each deck is only shuffled as deep as it has been dealt, so
+    dealing a few cards from every deck costs a fraction of shuffling them
+    all. For example:
+
+    from terminal_playing_cards import ShoeBatch
+
+    batch = ShoeBatch(10_000, rng=42)
+    # The first two cards of every deck
+    hands = batch.deal(2)
+    values = batch.table.values
+    totals = [sum(values[code] for code in hand) for hand in hands]
+
+    Attributes:
+        n_decks: Number of decks to shuffle.
+        specifications: A list of intialization options or a custom
+            dictionary detailing exactly how each deck should be built.
+            See help(Deck) for further information.
+        rng: A seed or random.Random instance used to shuffle the
+            decks. Defaults to the random module's global generator.
+        table: The CardTable used to encode the cards.
+        codes: An array of n_decks * deck_size card codes. Row i,
+            in other words codes[i * deck_size:(i + 1) * deck_size],
+            holds the shuffled order of deck i. Reading it shuffles
+            the rest of every deck.
+    """
+
+    def __init__(
+        self,
+        n_decks: int,
+        specifications: Union[list, dict] = None,
+        rng: Union[int, random.Random] = None,
+    ):
+        spec_dict = Deck._get_spec_dict(specifications)
+        self.table = CardTable(spec_dict)
+        self.n_decks = n_decks
+        self.deck_size = len(self.table)
+        self._rng = get_rng(rng)
+        # Every row starts out in order, and is shuffled one position at a
+        # time from the top by _shuffle_to()
+        self._codes = array("B", range(self.deck_size)) * n_decks
+        self._shuffled = 0
+        self._dealt = 0
+
+    def __len__(self):
+        return self.n_decks
+
+    def __getitem__(self, deck_index: int) -> memoryview:
+        """The shuffled codes of one deck, without copying them."""
+        if not -self.n_decks <= deck_index < self.n_decks:
+            raise IndexError("ShoeBatch deck index out of range")
+        start = (deck_index % self.n_decks) * self.deck_size
+        return memoryview(self.codes)[start : start + self.deck_size]
+
+    @property
+    def codes(self) -> array:
+        """Card codes of every deck, shuffled all the way down."""
+        self._shuffle_to(self.deck_size)
+        return self._codes
+
+    def _shuffle_to(self, depth: int) -> None:
+        """Shuffles the first depth positions of every deck.
+
+        Runs the Fisher-Yates shuffle one position at a time across all
+        rows, so each position is picked uniformly from the cards below
+        it. Shuffling to a depth in one call or in several gives the
+        same decks, and positions already dealt are never moved again.
+        """
+        size = self.deck_size
+        # The last card of a deck has nothing left to swap with
+        positions = range(self._shuffled, min(depth, size - 1))
+        if not positions:
+            return
+        # Swapping items of a list is faster than swapping those of an
+        # array, which pays for the conversion once about 16 positions deep
+        codes = self._codes.tolist() if len(positions) > 16 else self._codes
+        random_fx = self._rng.random
+        for position in positions:
+            span = size - position
+            for top in range(position, len(codes), size):
+                # Scaling random() is the pre-3.11 random.shuffle(x, random)
+                # pick, its bias is far below 2**-40 for spans of 256 or less
+                other = top + int(random_fx() * span)
+                codes[top], codes[other] = codes[other], codes[top]
+        if codes is not self._codes:
+            # Dealt hands are memoryviews of the array, so update it in place
+            self._codes[:] = array("B", codes)
+        self._shuffled = positions.stop
+
+    @property
+    def remaining(self) -> int:
+        """Number of cards not yet dealt from each deck."""
+        return self.deck_size - self._dealt
+
+    def deal(self, hand_size: int) -> list:
+        """Deals the next cards from the top of every deck.
+
+        Args:
+            hand_size: Number of cards to deal from each deck.
+
+        Returns:
+            A list with one memoryview of card codes per deck. The
+            memoryviews share memory with ShoeBatch.codes.
+        """
+        if not 0 <= hand_size <= self.remaining:
+            raise IndexError(
+                f"Cannot deal {hand_size} cards with {self.remaining} cards left"
+            )
+        start = self._dealt
+        self._dealt += hand_size
+        self._shuffle_to(self._dealt)
+        codes = memoryview(self._codes)
+        return [
+            codes[row + start : row + start + hand_size]
+            for row in range(0, len(self._codes), self.deck_size)
+        ]
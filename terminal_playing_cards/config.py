@@ -1,7 +1,7 @@
 # Ignore concerns about docstrings, since _all_ methods with docstrings
 # are picked up by sphinx-autodoc
 # pylint: disable=missing-docstring
-from colorama import Fore, Back
+from terminal_playing_cards.ansi import Fore, Back
 
 # Objects for the card module
 SUIT_SYMBOL_DICT = {
@@ -55,7 +55,7 @@ CARD_FACE_DICT = {
 }
 
 CARD_BACK_STYLE = Fore.WHITE + Back.LIGHTBLACK_EX
-# Objects for the deck module
+# Objects for the deck module. Call clear_spec_cache() after changing them
 DEFAULT_DECK_SPEC = {
     "A": {"clubs": 1, "diamonds": 1, "spades": 1, "hearts": 1},
     "2": {"clubs": 2, "diamonds": 2, "spades": 2, "hearts": 2},
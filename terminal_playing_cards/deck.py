@@ -3,10 +3,114 @@
 # pylint: disable=missing-docstring
 # pylint: disable=bad-continuation
 
-from typing import Union
-from random import shuffle
+import random
+import threading
+from array import array
+from collections.abc import Sequence
+from copy import copy
+from functools import lru_cache
+from itertools import islice
+from typing import AsyncIterator, Iterable, Union
 from terminal_playing_cards.card import Card
 from terminal_playing_cards.config import DEFAULT_DECK_SPEC
+from terminal_playing_cards.utils import get_rng
+
+# Compiled specifications shared by every Deck, keyed on the
+# specifications they were compiled from
+SPEC_CACHE_SIZE = 256
+
+
+def compile_spec(specifications: Union[list, dict] = None) -> tuple:
+    """Compiles Deck build specifications into a tuple of Card entries.
+
+    The compiled spec is a tuple of (face, suit, value) tuples, one per
+    Card, in the order the Deck is built, with every face and suit
+    already validated. It is immutable, and compiling the same
+    specifications again returns the cached result. See help(Deck)
+    for the specifications that are accepted. For example:
+
+    compile_spec(["ace_high"])[0]
+    # ("A", "clubs", 14)
+
+    Built-in specifications are compiled from DEFAULT_DECK_SPEC the
+    first time they are used, so call clear_spec_cache() after changing
+    it. Specifications with Card values that cannot be hashed, like
+    lists, are compiled every time instead of being cached.
+    """
+    # An empty dictionary builds the default deck, like no specifications
+    if specifications and isinstance(specifications, dict):
+        spec_items = tuple(
+            (face, tuple(suits.items())) for face, suits in specifications.items()
+        )
+        # Values like 1, 1.0 and True are equal, so they would share a
+        # cached spec if their types were not part of the key
+        value_types = tuple(
+            type(value) for _, suits in spec_items for _, value in suits
+        )
+        try:
+            return _compile_custom_spec(spec_items, value_types)
+        except TypeError:
+            # lru_cache cannot look up unhashable values
+            return _compile_items(spec_items)
+    return _compile_options(frozenset(specifications or ()))
+
+
+def clear_spec_cache() -> None:
+    """Forgets every compiled specification.
+
+    Call this after changing DEFAULT_DECK_SPEC, so that new Decks are
+    built from the changed specification. For example:
+
+    from terminal_playing_cards import Deck, clear_spec_cache
+    from terminal_playing_cards.config import DEFAULT_DECK_SPEC
+
+    DEFAULT_DECK_SPEC["A"]["clubs"] = 11
+    clear_spec_cache()
+    Deck()[0].value
+    # 11
+    """
+    _compile_options.cache_clear()
+    _compile_custom_spec.cache_clear()
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def _compile_options(options: frozenset) -> tuple:
+    """Compiles the default deck with built-in specifications applied."""
+    spec_items = []
+    for face, suits in DEFAULT_DECK_SPEC.items():
+        if face == "A" and "ace_high" in options:
+            suits = dict.fromkeys(suits, 14)
+        if face in ("J", "Q", "K") and "face_cards_are_ten" in options:
+            suits = dict.fromkeys(suits, 10)
+        spec_items.append((face, tuple(suits.items())))
+    return _compile_items(spec_items)
+
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def _compile_custom_spec(
+    spec_items: tuple, value_types: tuple  # pylint: disable=unused-argument
+) -> tuple:
+    """Compiles a custom specification given as nested (key, value) tuples.
+
+    value_types only keeps equal values of different types apart in the cache.
+    """
+    return _compile_items(spec_items)
+
+
+def _compile_items(spec_items: Iterable[tuple]) -> tuple:
+    """Validates every face and suit of a specification, without caching."""
+    # Validate each face and suit once, rather than once per Card
+    # pylint: disable=protected-access
+    valid_suits = {}
+    spec = []
+    for face, suits in spec_items:
+        valid_face = Card._valid_face(face)
+        for suit, value in suits:
+            if suit not in valid_suits:
+                valid_suits[suit] = Card._valid_suit(suit)
+            spec.append((valid_face, valid_suits[suit], value))
+    # pylint: enable=protected-access
+    return tuple(spec)
 
 
 class Deck(object):
@@ -37,6 +141,19 @@ class Deck(object):
             # and two of hearts with a value of 2
             special_specs = {"A": {"clubs": 1}, "2": {"hearts": 2}}
             special_deck = Deck(specifications=special_specs)
+        rng: A seed or random.Random instance the Deck is shuffled
+            with, for reproducible shuffles. Defaults to the random
+            module's global generator. See
+            terminal_playing_cards.utils.spawn_seeds for deriving
+            independent seeds for parallel workers.
+        n_decks: Number of copies of the deck to stack into a shoe,
+            for example to deal blackjack from eight decks. Defaults
+            to 1. For example:
+
+            shoe = Deck(n_decks=8)
+            shoe.shuffle()
+            # Which of the eight decks the top Card came from
+            shoe.origins[0]
         kwargs: Card initialization options.
             Current options include:
                 - hidden: Boolean determining if the
@@ -47,82 +164,240 @@ class Deck(object):
                     cards (J, Q, K). Defaults to True.
     """
 
-    def __init__(self, specifications: Union[list, dict] = None, **kwargs: bool):
-        spec_dict = (
-            DEFAULT_DECK_SPEC
-            if not specifications
-            else self._get_spec_dict(specifications)
-        )
-        self.cards = self._build(spec_dict, **kwargs)
-        # Attributes for __iter__ method
-        self._index = None
-        self._max = None
+    def __init__(
+        self,
+        specifications: Union[list, dict] = None,
+        rng: Union[int, random.Random] = None,
+        n_decks: int = 1,
+        **kwargs: bool,
+    ):
+        spec = compile_spec(specifications)
+        self.cards = self._build(spec, n_decks, **kwargs)
+        if n_decks > 1:
+            self._origins = self._build_origins(len(spec), n_decks)
+        # Keep None rather than the random module, which cannot be pickled
+        self.rng = get_rng(rng) if rng is not None else None
+        # Guards dealing when several threads share the Deck
+        self._lock = threading.Lock()
 
     @staticmethod
-    def _get_spec_dict(specifications: Union[list, dict]):
-        """Translates Deck build specifications into a dictionary."""
-        # Early return if they are passing custom specifications
-        if isinstance(specifications, dict):
-            return specifications
-
-        spec_dict = DEFAULT_DECK_SPEC
-
-        if "ace_high" in specifications:
-            for suit in spec_dict.get("A"):
-                spec_dict["A"][suit] = 14
-
-        if "face_cards_are_ten" in specifications:
-            for face_card in ["J", "Q", "K"]:
-                for suit in spec_dict.get(face_card):
-                    spec_dict[face_card][suit] = 10
-
+    def _get_spec_dict(specifications: Union[list, dict]) -> dict:
+        """Translates Deck build specifications into a new dictionary."""
+        spec_dict = {}
+        for face, suit, value in compile_spec(specifications):
+            spec_dict.setdefault(face, {})[suit] = value
         return spec_dict
 
     @staticmethod
-    def _build(specs_dict: dict, **kwargs: bool):
-        """Builds a deck of cards according to specifications."""
+    def _build(spec: tuple, n_decks: int = 1, **kwargs: bool) -> list:
+        """Builds one or more decks of cards from a compiled specification."""
+        hidden = kwargs.get("hidden", False)
+        picture = kwargs.get("picture", True)
+        # The faces and suits were validated when the spec was compiled
+        # pylint: disable=protected-access
+        from_valid = Card._from_valid
         return [
-            Card(face, suit, value=specs_dict.get(face).get(suit), **kwargs)
-            for face in specs_dict.keys()
-            for suit in specs_dict.get(face).keys()
+            from_valid(face, suit, value, hidden, picture)
+            for _ in range(n_decks)
+            for face, suit, value in spec
         ]
 
+    @staticmethod
+    def _build_origins(deck_size: int, n_decks: int) -> array:
+        """Builds the deck index of every Card of a freshly built shoe."""
+        origins = array("H")
+        for deck_index in range(n_decks):
+            origins.extend(array("H", [deck_index]) * deck_size)
+        return origins
+
+    @property
+    def cards(self) -> list:
+        """The list of Cards that have not been dealt yet.
+
+        For a View made with Deck.view(), a new list of the Cards it
+        currently shows, since the View shares its Cards with the Deck.
+        """
+        if self._top:
+            # Dealing from another thread moves the top while dropping
+            with self._lock:
+                self._drop_dealt()
+        if not isinstance(self._cards, list):
+            return list(self)
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards: list):
+        # The list read from cards and changed in place, like with
+        # deck.cards += more_cards, keeps its origins
+        keeps_origins = cards is getattr(self, "_cards", None) and not self._top
+        self._cards = cards
+        # Index of the top Card in self._cards. Cards above it have been
+        # dealt, but are only removed from the list every so often, so that
+        # dealing from the top does not shift every remaining Card each time
+        self._top = 0
+        if keeps_origins and self._origins is not None:
+            self._match_origins()
+        else:
+            self._origins = None
+
+    # Deck index of every Card in self._cards, for Decks built with
+    # n_decks. Kept in an array next to the Cards rather than on the Cards
+    # themselves, and None when the Deck does not keep track of it
+    _origins = None
+
+    @property
+    def origins(self) -> array:
+        """Which deck of a shoe each remaining Card came from.
+
+        An array of deck indexes, in the same order as the Cards, for
+        Decks built with n_decks and the Decks and Views made from them.
+        The indexes follow the Cards through shuffling, sorting, dealing
+        and adding. Cards added from Decks that do not keep track of it
+        count as coming from deck 0. None for other Decks.
+
+        Adding Cards with deck.cards += more_cards keeps track of them
+        like adding them to the Deck, but other changes made directly to
+        the list of Cards do not, and assigning a new list to cards
+        forgets the origins.
+        """
+        if self._origins is None:
+            return None
+        return self._origins[self._top :]
+
+    def _extend_origins(self, other, n_cards: int) -> None:
+        """Keeps track of where n_cards Cards about to be added came from."""
+        other_origins = getattr(other, "origins", None)
+        if self._origins is None and other_origins is None:
+            return
+        if self._origins is None:
+            self._origins = array("H", bytes(2 * len(self._cards)))
+        if other_origins is None:
+            other_origins = array("H", bytes(2 * n_cards))
+        self._origins += other_origins
+
+    def _match_origins(self) -> None:
+        """Lines the origins up with Cards added to or removed from the end."""
+        n_added = len(self._cards) - len(self._origins)
+        if n_added > 0:
+            self._origins += array("H", bytes(2 * n_added))
+        else:
+            del self._origins[len(self._cards) :]
+
+    def _drop_dealt(self) -> None:
+        """Removes the dealt Cards from the top of the list."""
+        del self._cards[: self._top]
+        if self._origins is not None:
+            del self._origins[: self._top]
+        self._top = 0
+
+    def _own_cards(self) -> None:
+        """Copies Cards shared with another Deck, before changing them."""
+        self.cards = list(self)
+
+    def _mutable_cards(self) -> list:
+        """The list of Cards, made this Deck's own so it can be changed."""
+        if not isinstance(self._cards, list):
+            self._own_cards()
+        return self.cards
+
     def __len__(self):
-        return len(self.cards)
+        return len(self._cards) - self._top
+
+    @staticmethod
+    def _cards_of(other) -> Iterable[Card]:
+        """Checks that a Deck, View or list of Cards can be added."""
+        if isinstance(other, Deck) or all(isinstance(card, Card) for card in other):
+            return other
+        raise NotImplementedError(
+            "Only a Deck/View, or list of Cards can be added to this class"
+        )
+
+    @classmethod
+    def _from_cards(cls, cards: list) -> "Deck":
+        """Creates a Deck of the given Cards, without building any."""
+        deck = cls.__new__(cls)
+        deck.cards = cards
+        deck.rng = None
+        deck._lock = threading.Lock()
+        return deck
+
+    @classmethod
+    def concat(cls, *decks) -> "Deck":
+        """Stacks Decks, Views or lists of Cards into a new Deck.
+
+        Builds the combined list of Cards in one go, so stacking many
+        Decks into a shoe does not copy the Cards over and over. For
+        example:
+
+        shoe = Deck.concat(*[Deck() for _ in range(8)])
+
+        Returns:
+            A new Deck (or View, when called on View) of all the Cards,
+            in the order given
+        """
+        combined = cls._from_cards([])
+        for deck in decks:
+            combined += deck
+        return combined
 
     def __add__(self, other):
-        """Add a Deck, View or Cards to another Deck/View"""
-        try:
-            self.cards += other.cards
-        except AttributeError:
-            is_a_card = [isinstance(card, Card) for card in other]
-            if all(is_a_card):
-                self.cards += other
-            else:
-                raise NotImplementedError(
-                    "Only a Deck/View, or list of Cards can be added to this class"
-                )
+        """Add a Deck, View or Cards to another Deck/View, making a new one"""
+        combined = copy(self)
+        combined.cards = list(self)
+        combined._origins = self.origins
+        combined += other
+        return combined
+
+    def __iadd__(self, other):
+        """Add a Deck, View or Cards to this Deck/View"""
+        # Take a snapshot first, in case a Deck is added to itself
+        other_cards = list(self._cards_of(other))
+        # Copy shared Cards and drop dealt ones first, which lines the
+        # origins up with the list of Cards
+        cards = self._mutable_cards()
+        self._extend_origins(other, len(other_cards))
+        cards.extend(other_cards)
         return self
 
     def __getitem__(self, key):
-        return self.cards[key]
+        if not self._top:
+            return self._cards[key]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._cards[self._top + start : self._top + max(start, stop)]
+            return [
+                self._cards[self._top + index] for index in range(start, stop, step)
+            ]
+        if not -len(self) <= key < len(self):
+            raise IndexError("Deck index out of range")
+        return self._cards[self._top + key % len(self)]
 
     def __iter__(self):
-        self._index = 0
-        self._max = len(self)
-        return self
-
-    def __next__(self):
-        if self._index < self._max:
-            card = self.cards[self._index]
-            self._index += 1
-            return card
-        raise StopIteration
+        # A new iterator every time, so nested and concurrent loops over
+        # the same Deck do not interfere with each other
+        if not self._top:
+            return iter(self._cards)
+        return islice(self._cards, self._top, None)
+
+    def __getstate__(self):
+        # Locks cannot be pickled, every copy gets its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def pop(self, index: int = 0) -> Card:
         """Pops a card out of the Deck.
 
-        Works just like the list.pop() method on a collection of Cards.
+        Works just like the list.pop() method on a collection of Cards,
+        except that popping the top Card, the default, takes the same
+        time no matter how many Cards are in the Deck. Popping the top
+        Card is safe to call from several threads sharing the Deck, just
+        like deal().
 
         Args:
             index: The index in the list at which to pop
@@ -131,49 +406,168 @@ class Deck(object):
         Returns:
             A Card object
         """
-        return self.cards.pop(index)
+        if index != 0:
+            card = self._mutable_cards().pop(index)
+            if self._origins is not None:
+                self._origins.pop(index)
+            return card
+        with self._lock:
+            if not self:
+                raise IndexError("pop from empty Deck")
+            return self._take_top(1)[0]
 
-    @staticmethod
-    def _sort_by_value(cards: list, order: str) -> list:
-        """Sorts cards according to value. Uses selection sort"""
-        unsorted_cards = cards.copy()
-        sorted_cards = []
-        sort_fx = min if order == "asc" else max
-        for _ in cards:
-            smallest_card = sort_fx(unsorted_cards)
-            unsorted_cards.remove(smallest_card)
-            sorted_cards.append(smallest_card)
-        return sorted_cards
+    def view(self, start: int = 0, stop: int = None):
+        """A View of some of the Cards, sharing them with this Deck.
+
+        Works like slicing, but without copying the Cards into a new
+        list. The View looks through to the Cards currently at those
+        positions, counting from the top of this Deck. Changing the View,
+        for example by sorting it or popping from it, first gives it its
+        own copy of the Cards. For example:
+
+        shoe = Deck(n_decks=8)
+        # Peek at the next five Cards in the shoe
+        print(shoe.view(0, 5))
+
+        Args:
+            start: Position of the first Card in the View. Defaults to 0
+            stop: Position after the last Card in the View. Defaults to
+                the end of the Deck.
+
+        Returns:
+            A View of the Cards
+        """
+        # View is built on top of Deck, so it can only be imported here
+        # pylint: disable=import-outside-toplevel
+        from terminal_playing_cards.view import View
+
+        return View(CardWindow(self, start, stop))
+
+    def _take_top(self, n_cards: int) -> list:
+        """Removes the top Cards of the Deck and returns them."""
+        if not isinstance(self._cards, list):
+            self._own_cards()
+        new_top = self._top + n_cards
+        top_cards = self._cards[self._top : new_top]
+        self._top = min(new_top, len(self._cards))
+        # Clearing out the dealt Cards all at once, once they make up half
+        # the list, keeps dealing from the top O(1) on average
+        if self._top * 2 >= len(self._cards):
+            self._drop_dealt()
+        return top_cards
+
+    def deal(self, n_cards: int = 1, **kwargs):
+        """Deals Cards off the top of the Deck into a View.
+
+        Safe to call from several threads sharing the same Deck. Every
+        Card is dealt exactly once, and the Cards of a hand are always
+        dealt together. For example:
+
+        deck.shuffle()
+        player_1_hand = deck.deal(5, spacing=-5)
+        print(player_1_hand)
+
+        Args:
+            n_cards: Number of Cards to deal. Defaults to 1
+            kwargs: View initialization options, like orientation
+                and spacing. See help(View) for further information.
+
+        Returns:
+            A View of the dealt Cards
+        """
+        # View is built on top of Deck, so it can only be imported here
+        # pylint: disable=import-outside-toplevel
+        from terminal_playing_cards.view import View
+
+        with self._lock:
+            if not 0 <= n_cards <= len(self):
+                raise IndexError(
+                    f"Cannot deal {n_cards} cards with {len(self)} cards left"
+                )
+            origins = self._origins
+            if origins is not None:
+                origins = origins[self._top : self._top + n_cards]
+            hand = View(self._take_top(n_cards), **kwargs)
+            hand._origins = origins
+            return hand
+
+    async def deal_async(
+        self, n_cards: int = None, chunk_size: int = 52
+    ) -> AsyncIterator[Card]:
+        """Deals Cards off the top of the Deck from within an event loop.
+
+        Hands control back to the event loop after every chunk_size
+        Cards, so dealing a large shoe does not hold up other tasks.
+        For example:
+
+        async for card in deck.deal_async(5):
+            hand += [card]
+
+        Args:
+            n_cards: Number of Cards to deal. Defaults to all
+                remaining Cards.
+            chunk_size: Number of Cards to deal between handing control
+                back to the event loop. Defaults to 52
+
+        Returns:
+            An asynchronous iterator of Card objects
+        """
+        # Only needed here, so importing the package stays cheap
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+
+        n_cards = len(self) if n_cards is None else n_cards
+        for dealt in range(1, n_cards + 1):
+            yield self.pop()
+            if dealt % chunk_size == 0:
+                await asyncio.sleep(0)
 
     @staticmethod
-    def _sort_by_suit(cards: list, order: list) -> list:
-        """Sorts cards according to given suit order"""
-        unsorted_cards = cards.copy()
-        sorted_cards = []
-        for suit in order:
-            cards_by_suit = [card for card in unsorted_cards if card.suit == suit]
-            # Skip empty lists for suits not in cards
-            if cards_by_suit == []:
-                continue
-            for card in cards_by_suit:
-                sorted_cards.append(card)
-                unsorted_cards.remove(card)
-
-        # Tack on any remaining cards not specified in the order
-        sorted_cards = (
-            sorted_cards if not unsorted_cards else sorted_cards + unsorted_cards
-        )
+    def _value_sort_key(order: str):
+        """Builds a sort key ordering cards by value"""
+        if order == "asc":
+            return lambda card: card.value
+        # Works for any comparable values, not just ones that can be negated
+        return lambda card: _Descending(card.value)
 
-        return sorted_cards
+    @staticmethod
+    def _suit_sort_key(order: list):
+        """Builds a sort key ordering cards by the given suit order"""
+        # Any remaining suits not specified in the order go at the end
+        suit_rank = {suit: rank for rank, suit in enumerate(order)}
+        remaining = len(order)
+        return lambda card: suit_rank.get(card.suit, remaining)
+
+    def _sort_key(self, sort_order: list, value_order: str, suit_order: list):
+        """Composes the sort stages into a single tuple sort key.
+
+        Sorting stably by each stage in turn gives the same order as one sort
+        keyed on the stages in reverse, so the last stage becomes the
+        primary key.
+        """
+        stage_keys = [
+            getattr(self, f"_{sort_option}_sort_key")(
+                {"value": value_order, "suit": suit_order}[sort_option]
+            )
+            for sort_option in reversed(sort_order)
+        ]
+        if len(stage_keys) == 1:
+            return stage_keys[0]
+        return lambda card: tuple(stage_key(card) for stage_key in stage_keys)
 
     def sort(
-        self, sort_order: list = None, value_order: str = None, suit_order: list = None
+        self,
+        sort_order: list = None,
+        value_order: str = None,
+        suit_order: list = None,
+        key=None,
     ) -> None:
         """Sort a collection of Cards.
 
         Sort a collection of Cards in place according to a given sort order.
         Defaults to sorting by Card value ascending and Card suit by
-        clubs, diamonds, spades, and then hearts.
+        clubs, diamonds, spades, and then hearts. The sort is stable, so
+        Cards that compare equal keep their current order.
 
         Args:
             sort_order: Specify whether to sort by value, suit, or
@@ -183,7 +577,11 @@ class Deck(object):
                 are asc and desc. Defaults to asc
             suit_order: Specify how to sort by suit. Available options
                 are clubs, diamonds, spades, and/or hearts. Defaults to
-                clubs, diamons, spades, and then hearts.
+                clubs, diamons, spades, and then hearts. Suits not given
+                are placed at the end.
+            key: A custom function of one Card to sort by instead,
+                just like the key argument of sorted(). When given, the
+                other arguments are ignored.
 
         Returns:
             None. Sorts the collection of Cards in place.
@@ -198,21 +596,93 @@ class Deck(object):
 
             my_hand.sort()
             my_hand.sort(sort_order=["value"], value_order="desc")
+            my_hand.sort(key=lambda card: card.face)
         """
-        # Set default arguments
-        sort_order = ["value", "suit"] if not sort_order else sort_order
-        suit_order = (
-            ["clubs", "diamonds", "spades", "hearts", "none"]
-            if not suit_order
-            else suit_order
-        )
-        value_order = "asc" if not value_order else value_order
+        if key is None:
+            # Set default arguments
+            sort_order = ["value", "suit"] if not sort_order else sort_order
+            suit_order = (
+                ["clubs", "diamonds", "spades", "hearts", "none"]
+                if not suit_order
+                else suit_order
+            )
+            value_order = "asc" if not value_order else value_order
+            key = self._sort_key(sort_order, value_order, suit_order)
+
+        self._sort_cards(key)
+
+    def _sort_cards(self, key) -> None:
+        """Sorts the Cards in place with a key function of one Card."""
+        if self._origins is None:
+            self.cards = sorted(self.cards, key=key)
+            return
+        cards = self.cards
+        self._reorder(sorted(range(len(cards)), key=lambda index: key(cards[index])))
+
+    def _reorder(self, order: list) -> None:
+        """Puts the Cards, and where they came from, in the given order."""
+        cards = self.cards
+        origins = self._origins
+        self.cards = [cards[index] for index in order]
+        self._origins = array("H", [origins[index] for index in order])
+
+    def shuffle(self, rng: Union[int, random.Random] = None) -> None:
+        """Shuffles the Cards in place.
+
+        Args:
+            rng: A seed or random.Random instance to shuffle with
+                this time. Defaults to the generator the Deck was
+                created with.
+        """
+        rng = get_rng(rng if rng is not None else self.rng)
+        if self._origins is None:
+            rng.shuffle(self._mutable_cards())
+            return
+        # Shuffling the positions moves the Cards exactly like shuffling
+        # the Cards themselves, and takes the origins along with them
+        order = list(range(len(self)))
+        rng.shuffle(order)
+        self._reorder(order)
+
+
+class _Descending(object):
+    """Sort key wrapper that sorts values from largest to smallest."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
 
-        for sort_option in sort_order:
-            sort_fx = getattr(self, f"_sort_by_{sort_option}")
-            order_params = locals().get(f"{sort_option}_order")
-            self.cards = sort_fx(self.cards, order_params)
+    def __eq__(self, other):
+        return self.value == other.value
 
-    def shuffle(self) -> None:
-        """Shuffles the Cards in place."""
-        shuffle(self.cards)
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+class CardWindow(Sequence):
+    """Read-only window onto a range of positions in a Deck.
+
+    Used as the Cards of a View that shares its Cards with a Deck.
+    Positions are counted from the current top of the Deck.
+    """
+
+    def __init__(self, deck: Deck, start: int = 0, stop: int = None):
+        self.deck = deck
+        self.start, self.stop, _ = slice(start, stop).indices(len(deck))
+
+    def __len__(self):
+        return max(0, min(self.stop, len(self.deck)) - self.start)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self.deck[self.start + start : self.start + max(start, stop)]
+            return [self.deck[self.start + index] for index in range(start, stop, step)]
+        if not -len(self) <= key < len(self):
+            raise IndexError("View index out of range")
+        return self.deck[self.start + key % len(self)]
+
+    def __iter__(self):
+        return islice(self.deck, self.start, self.start + len(self))
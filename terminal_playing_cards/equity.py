@@ -0,0 +1,352 @@
+"""Work out each player's share of a poker pot from the cards still to come"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+import math
+import random
+from collections import Counter
+from itertools import combinations
+from typing import Iterable, Iterator
+from terminal_playing_cards.compact import CompactDeck
+from terminal_playing_cards.eval import HandEvaluator
+from terminal_playing_cards.simulate import iter_chunks
+from terminal_playing_cards.tables import load_tables
+from terminal_playing_cards.utils import spawn_seeds
+
+
+class EquityResult(object):
+    """Each player's share of the pot over the boards played out so far.
+
+    Attributes:
+        wins: Number of boards each player won outright.
+        ties: Share of the pot each player won on tied boards. A board
+            split between two players adds 0.5 to each of them.
+        n_boards: Number of boards played out so far.
+        exact: Whether every possible board is being played out, rather
+            than a random sample of them.
+        done: Whether this is the final result of the calculation.
+        margin: How far off each equity could be, at the requested
+            confidence. 0.0 once every possible board has been played
+            out, and infinite part of the way through doing so, since
+            boards are then played out in order rather than at random.
+    """
+
+    def __init__(self, n_players: int, exact: bool, z_score: float):
+        self.wins = [0] * n_players
+        self.ties = [0.0] * n_players
+        self.n_boards = 0
+        self.exact = exact
+        self.done = False
+        self._z_score = z_score
+        # Sum of the squared share of every board, for the margin
+        self._squared_ties = [0.0] * n_players
+
+    @property
+    def equity(self) -> list:
+        """Each player's average share of the pot, between 0 and 1."""
+        if not self.n_boards:
+            return [0.0] * len(self.wins)
+        return [
+            (wins + ties) / self.n_boards for wins, ties in zip(self.wins, self.ties)
+        ]
+
+    @property
+    def margin(self) -> float:
+        if self.exact:
+            return 0.0 if self.done else math.inf
+        if self.n_boards < 2:
+            return math.inf
+        margin = 0.0
+        for wins, squared_ties, share in zip(
+            self.wins, self._squared_ties, self.equity
+        ):
+            variance = max((wins + squared_ties) / self.n_boards - share ** 2, 0.0)
+            margin = max(margin, self._z_score * math.sqrt(variance / self.n_boards))
+        return margin
+
+    def _combine(self, chunk_result: tuple) -> "EquityResult":
+        """Adds the results of a chunk of boards, making a new result."""
+        wins, ties, squared_ties, n_boards = chunk_result
+        combined = EquityResult(len(self.wins), self.exact, self._z_score)
+        combined.wins = [total + chunk for total, chunk in zip(self.wins, wins)]
+        combined.ties = [total + chunk for total, chunk in zip(self.ties, ties)]
+        combined._squared_ties = [
+            total + chunk for total, chunk in zip(self._squared_ties, squared_ties)
+        ]
+        combined.n_boards = self.n_boards + n_boards
+        return combined
+
+    def __repr__(self):
+        shares = ", ".join(f"{share:.4f}" for share in self.equity)
+        return (
+            f"EquityResult(equity=[{shares}], n_boards={self.n_boards}, "
+            f"exact={self.exact}, done={self.done})"
+        )
+
+
+def _z_score(confidence: float) -> float:
+    """Number of standard deviations that cover a two sided confidence."""
+    if not 0 < confidence < 1:
+        raise NotImplementedError("The confidence must be between 0 and 1")
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        middle = (low + high) / 2
+        if math.erf(middle / math.sqrt(2)) < confidence:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def _n_combinations(n_items: int, n_chosen: int) -> int:
+    if not 0 <= n_chosen <= n_items:
+        return 0
+    return math.factorial(n_items) // (
+        math.factorial(n_chosen) * math.factorial(n_items - n_chosen)
+    )
+
+
+def _exact_chunks(n_remaining: int, n_needed: int, chunk_size: int) -> list:
+    """Splits every possible board into chunks of about chunk_size boards.
+
+    Boards are grouped by their first few cards, their prefix, which are
+    indexes into the remaining cards. Each prefix is followed by every
+    combination of the cards after its last one, so a chunk can play its
+    boards without skipping past the boards of earlier chunks.
+
+    Returns:
+        A list with a (prefixes, n_boards) tuple per chunk
+    """
+    # Use the shortest prefixes that split the boards finely enough
+    n_prefix = 0
+    while n_prefix < n_needed and (
+        _n_combinations(n_remaining - n_prefix, n_needed - n_prefix) > chunk_size
+    ):
+        n_prefix += 1
+
+    chunks = []
+    prefixes = []
+    n_boards = 0
+    for prefix in combinations(range(n_remaining), n_prefix):
+        after_prefix = n_remaining - (prefix[-1] + 1 if prefix else 0)
+        prefix_boards = _n_combinations(after_prefix, n_needed - n_prefix)
+        if not prefix_boards:
+            continue
+        if prefixes and n_boards + prefix_boards > chunk_size:
+            chunks.append((prefixes, n_boards))
+            prefixes = []
+            n_boards = 0
+        prefixes.append(prefix)
+        n_boards += prefix_boards
+    if prefixes:
+        chunks.append((prefixes, n_boards))
+    return chunks
+
+
+def _exact_boards(remaining: list, n_needed: int, prefixes: list) -> Iterator[tuple]:
+    """Every possible board that starts with one of the prefixes, in order."""
+    for prefix in prefixes:
+        head = tuple(remaining[index] for index in prefix)
+        rest = remaining[prefix[-1] + 1 :] if prefix else remaining
+        for tail in combinations(rest, n_needed - len(prefix)):
+            yield head + tail
+
+
+def _play_boards(
+    holes: list,
+    remaining: list,
+    n_needed: int,
+    prefixes: list,
+    n_boards: int,
+    seed: int,
+) -> tuple:
+    """Plays out a chunk of boards and counts each player's share of them.
+
+    Plays every possible board starting with one of the prefixes when
+    seed is None, and otherwise n_boards boards drawn at random with the
+    seed. See help(_exact_chunks) for the prefixes.
+    """
+    if seed is None:
+        boards = _exact_boards(remaining, n_needed, prefixes)
+    else:
+        sample = random.Random(seed).sample
+        boards = (sample(remaining, n_needed) for _ in range(n_boards))
+
+    n_players = len(holes)
+    wins = [0] * n_players
+    ties = [0.0] * n_players
+    squared_ties = [0.0] * n_players
+    for hand_ranks in HandEvaluator().showdown(holes, boards):
+        best = max(hand_ranks)
+        n_best = hand_ranks.count(best)
+        if n_best == 1:
+            wins[hand_ranks.index(best)] += 1
+            continue
+        share = 1 / n_best
+        for player, hand_rank in enumerate(hand_ranks):
+            if hand_rank == best:
+                ties[player] += share
+                squared_ties[player] += share * share
+    return wins, ties, squared_ties, n_boards
+
+
+def _remaining_codes(evaluator: HandEvaluator, deck, known_codes: list) -> list:
+    """Codes of the cards in the deck that are not already known."""
+    if deck is None:
+        deck_codes = range(len(evaluator.table))
+    elif isinstance(deck, CompactDeck) and deck.table == evaluator.table:
+        deck_codes = deck.codes
+    else:
+        deck_codes = evaluator.encode([deck])[0]
+    # Leave out known cards that were not taken out of the deck
+    known_counts = Counter(known_codes)
+    remaining = []
+    for code in deck_codes:
+        if known_counts[code]:
+            known_counts[code] -= 1
+        else:
+            remaining.append(code)
+    # The order of the deck does not matter, so sort it for reproducible samples
+    return sorted(remaining)
+
+
+def iter_equity(
+    hands: Iterable[Iterable],
+    deck: Iterable = None,
+    board: Iterable = None,
+    board_size: int = 5,
+    max_boards: int = 100_000,
+    margin: float = 0.005,
+    confidence: float = 0.95,
+    max_samples: int = 1_000_000,
+    seed: int = None,
+    max_workers: int = None,
+    chunk_size: int = 20_000,
+) -> Iterator[EquityResult]:
+    """Works out each player's share of the pot, yielding results as they arrive.
+
+    Deals out the rest of the board from the cards left in the deck, like
+    in Texas hold'em, and ranks every player's hole cards together with
+    the board. When there are at most max_boards ways to finish the board,
+    every one of them is played out for the exact equity. Otherwise
+    boards are sampled at random until every player's equity is known
+    to within margin, at the given confidence, or max_samples boards
+    have been played. For example:
+
+    from terminal_playing_cards import Deck
+    from terminal_playing_cards.equity import iter_equity
+
+    deck = Deck()
+    deck.shuffle()
+    player_1 = deck.deal(2)
+    player_2 = deck.deal(2)
+    flop = deck.deal(3)
+    for result in iter_equity([player_1, player_2], deck=deck, board=flop):
+        print(result.equity)
+
+    Hands are ranked with terminal_playing_cards.eval.HandEvaluator, and
+    boards are played out in chunks in worker processes with
+    terminal_playing_cards.simulate.iter_chunks.
+
+    Args:
+        hands: The hole cards of every player, as Views or lists of Cards.
+        deck: The Deck, View or list of Cards that the rest of the board
+            is dealt from, like a Deck that the hands and board were dealt
+            out of. Known cards still in it are left out. Defaults to a
+            standard 52 card deck without the known cards.
+        board: Community cards that are already dealt. Defaults to none.
+        board_size: Number of community cards on a finished board.
+            Defaults to 5.
+        max_boards: Largest number of possible boards to play out exactly.
+        margin: Sample boards until every equity is this close to the
+            exact equity, at the given confidence. Defaults to 0.005.
+        confidence: Confidence of the margin. Defaults to 0.95.
+        max_samples: Most boards to sample, whatever the margin.
+        seed: Root seed for sampling. Defaults to a random seed. The same
+            seed and chunk_size give the same results, no matter how many
+            workers play them.
+        max_workers: Number of worker processes. Defaults to the number
+            of CPUs. With a single worker, or a single chunk of boards,
+            the boards are played in this process.
+        chunk_size: Number of boards each worker plays at a time, and so
+            how often results are yielded.
+
+    Returns:
+        An iterator over EquityResults, one per chunk of boards. The last
+        one has done set to True.
+    """
+    evaluator = HandEvaluator()
+    holes = evaluator.encode(hands)
+    board_codes = evaluator.encode([board if board is not None else []])[0]
+    known_codes = [code for hole in holes for code in hole] + list(board_codes)
+    if len(set(known_codes)) != len(known_codes):
+        raise NotImplementedError("The same card cannot be in two places at once")
+    remaining = _remaining_codes(evaluator, deck, known_codes)
+    n_needed = board_size - len(board_codes)
+    if not 0 <= n_needed <= len(remaining):
+        raise NotImplementedError(
+            f"Cannot deal {n_needed} more board cards from {len(remaining)} cards"
+        )
+    # The known board cards are part of every player's hand
+    holes = [hole + board_codes for hole in holes]
+
+    n_possible = _n_combinations(len(remaining), n_needed)
+    exact = n_possible <= max_boards
+    if not exact and max_samples < 1:
+        raise NotImplementedError("At least one board must be sampled")
+    if exact:
+        chunks = _exact_chunks(len(remaining), n_needed, chunk_size)
+        chunk_seeds = [None] * len(chunks)
+    else:
+        chunks = [
+            (None, min(chunk_size, max_samples - start))
+            for start in range(0, max_samples, chunk_size)
+        ]
+        seed = random.getrandbits(64) if seed is None else seed
+        chunk_seeds = spawn_seeds(seed, len(chunks))
+    chunk_args = [
+        (holes, remaining, n_needed, prefixes, chunk_boards, chunk_seed)
+        for (prefixes, chunk_boards), chunk_seed in zip(chunks, chunk_seeds)
+    ]
+    # Generate the rank tables before any worker needs them, so that
+    # every worker maps the same cache file instead of building its own
+    load_tables()
+
+    result = EquityResult(len(holes), exact, _z_score(confidence))
+    chunk_results = iter_chunks(_play_boards, chunk_args, max_workers)
+    for chunk, chunk_result in enumerate(chunk_results, 1):
+        # pylint: disable=protected-access
+        result = result._combine(chunk_result)
+        # pylint: enable=protected-access
+        result.done = chunk == len(chunk_args) or (
+            not exact and result.margin <= margin
+        )
+        yield result
+        if result.done:
+            return
+
+
+def equity(hands: Iterable[Iterable], **kwargs) -> EquityResult:
+    """Works out each player's share of the pot.
+
+    For example, the chance of pocket aces beating pocket kings:
+
+    from terminal_playing_cards import Card
+    from terminal_playing_cards.equity import equity
+
+    aces = [Card("A", "spades"), Card("A", "hearts")]
+    kings = [Card("K", "spades"), Card("K", "hearts")]
+    equity([aces, kings], seed=42).equity[0]
+
+    See help(iter_equity) for a description of the arguments.
+
+    Returns:
+        The final EquityResult
+    """
+    final_result = None
+    for result in iter_equity(hands, **kwargs):
+        final_result = result
+    if final_result is None:
+        raise NotImplementedError("No boards were played out")
+    return final_result
@@ -0,0 +1,297 @@
+"""Evaluate large batches of hands stored as card codes"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+from array import array
+from functools import lru_cache
+from typing import Iterable, Iterator, Sequence
+from terminal_playing_cards.compact import CardTable
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.tables import (
+    CATEGORY_NAMES,
+    NO_HAND,
+    RANK_WEIGHTS_5,
+    RANK_WEIGHTS_7,
+    PokerTables,
+    load_tables,
+)
+
+# Poker rank of every face, from the two up to the ace
+POKER_RANKS = {
+    face: rank
+    for rank, face in enumerate(
+        ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+    )
+}
+POKER_SUITS = {"clubs": 0, "diamonds": 1, "spades": 2, "hearts": 3}
+
+# Poker hand keys add up one term per card: the weight of its rank (see
+# terminal_playing_cards.tables), followed by three bits per suit counting
+# the cards of that suit. Rank weights of up to seven cards, including
+# impossible hands like five of a kind, add up to less than 1 << 24
+_SUIT_SHIFT = 24
+_RANK_MASK = (1 << _SUIT_SHIFT) - 1
+# Blackjack keys count the aces above the points of the hand
+_ACE_SHIFT = 16
+
+
+def _blackjack_key(face: str) -> int:
+    """Blackjack points of a face, with aces counted low and marked."""
+    if face == "A":
+        return (1 << _ACE_SHIFT) + 1
+    if face in ("J", "Q", "K"):
+        return 10
+    return int(face) if face.isdigit() else 0
+
+
+@lru_cache(maxsize=None)
+def _flush_suits() -> tuple:
+    """Maps the suit part of every hand key to its flush suit, or -1."""
+    table = []
+    for suit_counts in range(1 << 12):
+        flush_suit = -1
+        for suit in range(4):
+            if (suit_counts >> 3 * suit) & 0b111 >= 5:
+                flush_suit = suit
+        table.append(flush_suit)
+    return tuple(table)
+
+
+def category(hand_rank: int) -> str:
+    """Name of the category of a hand rank, like "full house"."""
+    return CATEGORY_NAMES[hand_rank >> 20]
+
+
+def split_hands(codes: Sequence[int], hand_size: int) -> list:
+    """Splits a flat buffer of card codes into hands, without copying.
+
+    For example, the rows of a ShoeBatch dealt as one buffer:
+    split_hands(batch.codes, batch.deck_size)
+    """
+    codes = memoryview(codes)
+    return [
+        codes[start : start + hand_size] for start in range(0, len(codes), hand_size)
+    ]
+
+
+class HandEvaluator(object):
+    """Evaluates batches of hands given as card codes.
+
+    Hands are sequences of codes from a CardTable, like the hands dealt
+    by ShoeBatch.deal or the codes of a CompactDeck. Everything about a
+    card that the evaluation needs is looked up once, when the evaluator
+    is built, so each hand is scored with a single table lookup per card
+    and no Card objects. For example:
+
+    from terminal_playing_cards import ShoeBatch
+    from terminal_playing_cards.eval import HandEvaluator, category
+
+    batch = ShoeBatch(100_000, rng=42)
+    evaluator = HandEvaluator(batch.table)
+    totals, soft = evaluator.blackjack_totals(batch.deal(2))
+    hand_ranks = evaluator.poker_ranks(batch.deal(5))
+    category(max(hand_ranks))
+
+    Attributes:
+        table: The CardTable the codes come from. Defaults to the table
+            of a standard 52 card deck.
+    """
+
+    def __init__(self, table: CardTable = None):
+        # pylint: disable=protected-access
+        self.table = (
+            table if table is not None else CardTable(Deck._get_spec_dict(None))
+        )
+        # pylint: enable=protected-access
+        self._values = self.table.values
+        self._blackjack_keys = tuple(_blackjack_key(face) for face in self.table.faces)
+        self._poker_keys = None
+        if all(face in POKER_RANKS for face in self.table.faces) and all(
+            suit in POKER_SUITS for suit in self.table.suits
+        ):
+            self._poker_keys = {
+                hand_size: self._poker_key_table(weights)
+                for hand_size, weights in [
+                    (5, RANK_WEIGHTS_5),
+                    (6, RANK_WEIGHTS_7),
+                    (7, RANK_WEIGHTS_7),
+                ]
+            }
+            self._poker_suits = tuple(POKER_SUITS[suit] for suit in self.table.suits)
+            self._poker_bits = tuple(
+                1 << POKER_RANKS[face] for face in self.table.faces
+            )
+
+    def encode(self, hands: Iterable[Iterable]) -> list:
+        """Encodes Views, Decks or lists of Cards as arrays of card codes."""
+        return [
+            array("B", [self.table.encode(card) for card in hand]) for hand in hands
+        ]
+
+    def totals(self, hands: Iterable[Sequence[int]]) -> array:
+        """Adds up the values of the cards in each hand.
+
+        Gives the same totals as sum(view) on the decoded hands.
+
+        Returns:
+            An array with the total of every hand
+        """
+        values = self._values.__getitem__
+        return array("q", [sum(map(values, hand)) for hand in hands])
+
+    def blackjack_totals(self, hands: Iterable[Sequence[int]]) -> tuple:
+        """Counts the blackjack points of each hand.
+
+        Number cards count their face, and jacks, queens and kings count
+        ten. An ace counts eleven, like an "ace_high" deck counts it high,
+        unless that would bust the hand, in which case it counts one.
+
+        Returns:
+            A tuple of two arrays, the points of every hand and whether
+            each hand is soft, in other words counts an ace as eleven
+        """
+        keys = self._blackjack_keys.__getitem__
+        points = array("H")
+        soft = array("B")
+        ace_mask = (1 << _ACE_SHIFT) - 1
+        for hand in hands:
+            key = sum(map(keys, hand))
+            hand_points = key & ace_mask
+            is_soft = key > ace_mask and hand_points <= 11
+            points.append(hand_points + 10 if is_soft else hand_points)
+            soft.append(is_soft)
+        return points, soft
+
+    def _poker_key_table(self, weights: tuple) -> tuple:
+        """Builds the poker hand key term of every card code."""
+        return tuple(
+            weights[POKER_RANKS[face]] + (1 << _SUIT_SHIFT + 3 * POKER_SUITS[suit])
+            for face, suit in zip(self.table.faces, self.table.suits)
+        )
+
+    def poker_ranks(
+        self, hands: Iterable[Sequence[int]], tables: PokerTables = None
+    ) -> array:
+        """Ranks the best five card poker hand within each hand.
+
+        Hands hold five to seven cards. Higher hand ranks beat lower ones,
+        equal hand ranks tie, and category(hand_rank) names the hand.
+        Every hand is looked up in precomputed rank tables, which are
+        generated the first time they are needed and cached on disk for
+        later runs. See help(terminal_playing_cards.tables.load_tables).
+
+        Args:
+            hands: Sequences of card codes.
+            tables: The PokerTables to look the hands up in. Defaults
+                to the tables in the default cache directory.
+
+        Returns:
+            An array with the rank of every hand
+        """
+        tables = self._poker_tables(tables)
+        ranks = tables.ranks
+        lookups = {}
+        hand_ranks = array("L")
+        for hand in hands:
+            try:
+                keys, rank_table = lookups[len(hand)]
+            except KeyError:
+                keys, rank_table = lookups[len(hand)] = self._lookup(len(hand), tables)
+            key = sum(map(keys, hand))
+            hand_ranks.append(ranks[self._ordinal(key, rank_table, tables, (hand,))])
+        return hand_ranks
+
+    def showdown(
+        self,
+        holes: Sequence[Sequence[int]],
+        boards: Iterable[Sequence[int]],
+        tables: PokerTables = None,
+    ) -> Iterator[list]:
+        """Ranks the hand of every player on each of many boards.
+
+        Each player's hand is their hole cards together with the board,
+        as in Texas hold'em. The hole cards are only looked up once, and
+        each board once for all players, so ranking another board costs
+        one lookup per board card plus one per player. For example:
+
+        # Every possible river, given the flop and the turn
+        rivers = ([code] for code in remaining_codes)
+        for hand_ranks in evaluator.showdown([hole_1, hole_2], rivers):
+            ...
+
+        Args:
+            holes: The hole cards of every player, as sequences of card
+                codes. Every player must hold the same number of cards.
+            boards: Sequences of community card codes.
+            tables: See help(HandEvaluator.poker_ranks).
+
+        Returns:
+            An iterator with, for every board, a list of the rank of
+            every player's hand
+        """
+        if len({len(hole) for hole in holes}) > 1:
+            raise NotImplementedError("Every player must hold the same number of cards")
+        tables = self._poker_tables(tables)
+        ranks = tables.ranks
+        lookups = {}
+        for board in boards:
+            hand_size = len(holes[0]) + len(board)
+            try:
+                keys, rank_table, hole_keys = lookups[hand_size]
+            except KeyError:
+                keys, rank_table = self._lookup(hand_size, tables)
+                hole_keys = [sum(map(keys, hole)) for hole in holes]
+                lookups[hand_size] = (keys, rank_table, hole_keys)
+            board_key = sum(map(keys, board))
+            hand_ranks = []
+            for hole, hole_key in zip(holes, hole_keys):
+                ordinal = self._ordinal(
+                    board_key + hole_key, rank_table, tables, (hole, board)
+                )
+                hand_ranks.append(ranks[ordinal])
+            yield hand_ranks
+
+    def _poker_tables(self, tables: PokerTables = None) -> PokerTables:
+        """Checks that poker hands can be ranked, and loads the tables."""
+        if self._poker_keys is None:
+            raise NotImplementedError(
+                "Poker hands can only be ranked for decks of the standard "
+                "faces and suits"
+            )
+        return tables if tables is not None else load_tables()
+
+    def _lookup(self, hand_size: int, tables: PokerTables) -> tuple:
+        """The card key lookup and rank table for hands of a size."""
+        if not 5 <= hand_size <= 7:
+            raise NotImplementedError(
+                f"Poker hands must have five to seven cards, not {hand_size}"
+            )
+        rank_table = {5: tables.five, 7: tables.seven}.get(hand_size)
+        if rank_table is None:
+            rank_table = tables.six
+        return self._poker_keys[hand_size].__getitem__, rank_table
+
+    def _ordinal(self, key: int, rank_table, tables: PokerTables, cards: tuple) -> int:
+        """Looks up the ordinal of the hand with the given key.
+
+        cards holds the sequences of card codes that make up the hand,
+        which are only needed to find the best flush.
+        """
+        try:
+            ordinal = rank_table[key & _RANK_MASK]
+        except IndexError:
+            ordinal = NO_HAND
+        if ordinal == NO_HAND:
+            raise NotImplementedError("A poker hand cannot hold five of a kind")
+        flush_suit = _flush_suits()[key >> _SUIT_SHIFT]
+        if flush_suit >= 0:
+            suits = self._poker_suits
+            bits = self._poker_bits
+            rank_mask = 0
+            for hand in cards:
+                for code in hand:
+                    if suits[code] == flush_suit:
+                        rank_mask |= bits[code]
+            ordinal = max(ordinal, tables.flush[rank_mask])
+        return ordinal
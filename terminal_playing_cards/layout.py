@@ -0,0 +1,116 @@
+"""Wrap the cards of large Views into rows that fit the terminal"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+import shutil
+from terminal_playing_cards.ansi import Style
+from terminal_playing_cards.utils import text_width
+from terminal_playing_cards.view import View
+
+
+class WrappedView(View):
+    """A View that wraps its cards into rows to fit the terminal.
+
+    Lays the cards out from left to right just like a horizontal View,
+    starting a new row of cards whenever the next card would not fit in
+    the width. Rows respect the spacing of the View, including
+    overlapping cards. For example:
+
+    from terminal_playing_cards import Deck
+    from terminal_playing_cards.layout import WrappedView
+
+    shoe = Deck(n_decks=8)
+    print(WrappedView(shoe.cards, spacing=-5))
+
+    Vertical WrappedViews are printed just like a vertical View.
+
+    Attributes:
+        cards: A list of Cards.
+        orientation: See help(View) for further information.
+        spacing: See help(View) for further information.
+        width: Number of terminal columns each row of cards must fit
+            in. Defaults to None, in which case the width of the terminal
+            is detected every time the View is printed. A single card
+            wider than the width gets a row to itself.
+        row_spacing: Number of blank lines between rows of cards.
+            Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        cards: list,
+        orientation: str = "horizontal",
+        spacing: int = 2,
+        width: int = None,
+        row_spacing: int = 1,
+    ):
+        super().__init__(cards, orientation=orientation, spacing=spacing)
+        self.width = width
+        self.row_spacing = row_spacing
+
+    def _plan_rows(self) -> list:
+        """Splits the card plans of the View into rows that fit the width.
+
+        Returns a list of rows, each a list of card plans as described in
+        help(View._plan_horizontal), with the first and last card of every
+        row drawn like the first and last card of a View.
+        """
+        width = self.width
+        if width is None:
+            width = shutil.get_terminal_size().columns
+        card_plans = self._plan_horizontal()
+        uncovered_end = (Style.RESET_ALL, " " * max(self._spacing, 0))
+        no_cells_hidden = (0,) * 7
+
+        rows = []
+        row = []
+        # Columns taken up on each layer by the cards already in the row,
+        # if the next card were placed after them
+        row_widths = [0] * 7
+        for card_start, style, prefixes, card_end, hidden in card_plans:
+            if not row:
+                card_start = None
+            start_width = text_width(card_start[1]) if card_start else 0
+            # Width of each layer if this card ended the row
+            full_widths = [
+                row_widths[layer] + start_width + text_width(prefixes[layer][-1])
+                for layer in range(7)
+            ]
+            if row and max(full_widths) + len(uncovered_end[1]) > width:
+                rows.append(self._end_row(row, uncovered_end, no_cells_hidden))
+                row = []
+                row_widths = [0] * 7
+                card_start = None
+                start_width = 0
+            row.append((card_start, style, prefixes, card_end, hidden))
+            end_width = text_width(card_end[1]) if card_end else 0
+            for layer in range(7):
+                row_widths[layer] += (
+                    start_width
+                    + text_width(prefixes[layer][-1 - hidden[layer]])
+                    + end_width
+                )
+        if row:
+            rows.append(self._end_row(row, uncovered_end, no_cells_hidden))
+        return rows
+
+    @staticmethod
+    def _end_row(row: list, uncovered_end: tuple, no_cells_hidden: tuple) -> list:
+        """Uncovers the last card of a row, since no card follows it."""
+        card_start, style, prefixes, _, _ = row[-1]
+        row[-1] = (card_start, style, prefixes, uncovered_end, no_cells_hidden)
+        return row
+
+    def _merge_horizontal(self):
+        """Merges the cards row by row, one terminal line at a time.
+
+        Plans every card once, then builds each line of a row out of the
+        cached segments of just the cards in that row, so rendering is
+        linear in the number of cards.
+        """
+        for row_index, row in enumerate(self._plan_rows()):
+            if row_index:
+                for _ in range(self.row_spacing):
+                    yield []
+            yield from self._merge_plans(row)
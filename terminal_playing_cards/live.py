@@ -0,0 +1,173 @@
+"""Keep Views up to date on screen by redrawing only what changed"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+from terminal_playing_cards.ansi import (
+    DEFAULT_STATE,
+    apply_sgr,
+    enable_terminal,
+    sgr_delta,
+)
+from terminal_playing_cards.utils import text_width
+from terminal_playing_cards.view import View
+
+
+def _width(cells: list) -> int:
+    """Number of terminal columns a list of cells takes up."""
+    return sum(text_width(char) for _, char in cells)
+
+
+def _frame(view: View) -> list:
+    """Renders a View as lines of (style, character) cells."""
+    merge_fx = getattr(view, f"_merge_{view.orientation}")
+    frame = []
+    for segments in merge_fx():
+        line = []
+        state = DEFAULT_STATE
+        for escape, text in segments:
+            state = apply_sgr(state, escape)
+            line.extend((state, char) for char in text)
+        frame.append(line)
+    return frame
+
+
+def _draw(cells: list) -> str:
+    """Writes cells with as few escape codes as possible."""
+    output = []
+    written_state = DEFAULT_STATE
+    for state, char in cells:
+        output.append(sgr_delta(written_state, state))
+        output.append(char)
+        written_state = state
+    output.append(sgr_delta(written_state, DEFAULT_STATE))
+    return "".join(output)
+
+
+class LiveTable(object):
+    """A screen of Views that redraws only the cells that changed.
+
+    Remembers what each View looked like the last time it was drawn.
+    Every refresh compares that with how the View looks now and writes
+    cursor movements followed by just the changed characters, so the
+    amount written is proportional to the change rather than the size of
+    the table. For example:
+
+    import sys
+    from terminal_playing_cards import Deck, View
+    from terminal_playing_cards.live import LiveTable
+
+    deck = Deck(hidden=True)
+    dealer = View([deck.pop() for _ in range(2)])
+    table = LiveTable(stream=sys.stdout)
+    table.add(dealer, row=1)
+    table.refresh()
+    # Flip the dealer's second card, only that card is redrawn
+    dealer[1].hidden = False
+    table.refresh()
+
+    Attributes:
+        stream: A text file-like object to write the updates to, like
+            sys.stdout. Defaults to None, in which case refresh only
+            returns the updates.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        # Each entry is [view, row, column, last drawn frame]
+        self._views = []
+
+    def add(self, view: View, row: int, column: int = 1) -> None:
+        """Places a View on the screen.
+
+        Args:
+            view: The View to keep up to date.
+            row: Terminal row of the top of the View, starting at 1.
+            column: Terminal column of the left of the View,
+                starting at 1. Defaults to 1.
+        """
+        self._views.append([view, row, column, []])
+
+    def remove(self, view: View) -> str:
+        """Takes a View off the screen, erasing it.
+
+        Returns:
+            The escape codes and characters written to erase it.
+        """
+        for entry in self._views:
+            if entry[0] is view:
+                self._views.remove(entry)
+                _, row, column, last_frame = entry
+                return self._write(self._diff(last_frame, [], row, column))
+        raise NotImplementedError("This View is not on the LiveTable")
+
+    def refresh(self) -> str:
+        """Redraws the cells of every View that changed since the last refresh.
+
+        The first refresh after a View is added draws all of it.
+
+        Returns:
+            The escape codes and characters written.
+        """
+        updates = []
+        for entry in self._views:
+            view, row, column, last_frame = entry
+            frame = _frame(view)
+            updates.append(self._diff(last_frame, frame, row, column))
+            entry[3] = frame
+        return self._write("".join(updates))
+
+    def redraw(self) -> str:
+        """Draws every View in full, e.g. after the screen was cleared."""
+        for entry in self._views:
+            entry[3] = []
+        return self.refresh()
+
+    def _write(self, updates: str) -> str:
+        if self.stream is not None and updates:
+            enable_terminal()
+            self.stream.write(updates)
+        return updates
+
+    @staticmethod
+    def _diff(last_frame: list, frame: list, row: int, column: int) -> str:
+        """Builds the updates that turn the last frame into the new one."""
+        updates = []
+        for line_index in range(max(len(last_frame), len(frame))):
+            last_line = last_frame[line_index] if line_index < len(last_frame) else []
+            line = frame[line_index] if line_index < len(frame) else []
+            if line == last_line:
+                continue
+            # Only redraw the span between the first and last changed cells
+            first_change = 0
+            while (
+                first_change < min(len(line), len(last_line))
+                and line[first_change] == last_line[first_change]
+            ):
+                first_change += 1
+            end_change = len(line)
+            last_end_change = len(last_line)
+            while (
+                end_change > first_change
+                and last_end_change > first_change
+                and line[end_change - 1] == last_line[last_end_change - 1]
+            ):
+                end_change -= 1
+                last_end_change -= 1
+            changed_cells = line[first_change:end_change]
+            # If the change is wider or narrower than before, everything
+            # after it moves, so redraw the rest of the line and blank out
+            # anything left over from a wider line
+            if _width(changed_cells) != _width(
+                last_line[first_change:last_end_change]
+            ):
+                changed_cells = line[first_change:]
+                leftover_width = _width(last_line[first_change:]) - _width(
+                    changed_cells
+                )
+                changed_cells += [(DEFAULT_STATE, " ")] * max(leftover_width, 0)
+            offset = _width(line[:first_change])
+            updates.append(
+                f"\x1b[{row + line_index};{column + offset}H" + _draw(changed_cells)
+            )
+        return "".join(updates)
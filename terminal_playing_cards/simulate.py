@@ -0,0 +1,164 @@
+"""Play many independent hands in parallel worker processes"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+import random
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Callable, Iterator, Sequence, Union
+from terminal_playing_cards.compact import CompactDeck
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.utils import spawn_seeds
+
+
+def _play_chunk(
+    hand_fx: Callable, spec_dict: dict, seed: int, n_hands: int, card_options: dict
+) -> list:
+    """Plays a chunk of hands, each with a freshly shuffled CompactDeck."""
+    deck = CompactDeck(specifications=spec_dict, rng=seed, **card_options)
+    full_deck = deck.codes
+    results = []
+    for _ in range(n_hands):
+        deck.codes = array("B", full_deck)
+        deck.shuffle()
+        results.append(hand_fx(deck))
+    return results
+
+
+def iter_simulation(
+    hand_fx: Callable,
+    n_hands: int,
+    specifications: Union[list, dict] = None,
+    seed: int = None,
+    max_workers: int = None,
+    chunk_size: int = 1000,
+    **kwargs: bool,
+) -> Iterator[list]:
+    """Plays hands in worker processes and yields results as they arrive.
+
+    Every hand gets its own freshly shuffled CompactDeck, which is passed
+    to hand_fx. Hands are played in chunks, and each chunk shuffles with
+    its own seed derived from the root seed, so a run with the same seed
+    and chunk_size gives the same results no matter how many workers
+    play it.
+
+    Args:
+        hand_fx: Function that plays one hand, given a shuffled
+            CompactDeck, and returns its result. Must be defined at the
+            top level of a module so it can be sent to worker processes.
+        n_hands: Number of hands to play.
+        specifications: A list of intialization options or a custom
+            dictionary detailing exactly how each deck should be built.
+            See help(Deck) for further information.
+        seed: Root seed for the run. Defaults to a random seed.
+        max_workers: Number of worker processes. Defaults to the number
+            of CPUs. With a single worker the hands are played in this
+            process.
+        chunk_size: Number of hands each worker plays at a time.
+        kwargs: Card initialization options. See kwargs in help(Deck)
+            for further information.
+
+    Returns:
+        An iterator over lists of hand results, one list per chunk,
+        in the order the hands were played.
+    """
+    # pylint: disable=protected-access
+    spec_dict = Deck._get_spec_dict(specifications)
+    # pylint: enable=protected-access
+    seed = random.getrandbits(64) if seed is None else seed
+    chunk_sizes = [
+        min(chunk_size, n_hands - start) for start in range(0, n_hands, chunk_size)
+    ]
+    chunk_args = [
+        (hand_fx, spec_dict, chunk_seed, chunk_hands, kwargs)
+        for chunk_seed, chunk_hands in zip(
+            spawn_seeds(seed, len(chunk_sizes)), chunk_sizes
+        )
+    ]
+    yield from iter_chunks(_play_chunk, chunk_args, max_workers)
+
+
+def iter_chunks(
+    chunk_fx: Callable, chunk_args: Sequence[tuple], max_workers: int = None
+) -> Iterator:
+    """Runs chunks of work in worker processes and yields results in order.
+
+    Calls chunk_fx(*args) for every args in chunk_args. Only a few chunks
+    are queued up per worker at a time, so closing the iterator early
+    leaves the rest of the chunks unplayed.
+
+    Args:
+        chunk_fx: Function that runs one chunk. Must be defined at the
+            top level of a module so it can be sent to worker processes.
+        chunk_args: The arguments of every chunk.
+        max_workers: Number of worker processes. Defaults to the number
+            of CPUs. With a single worker, or a single chunk, the chunks
+            are run in this process.
+
+    Returns:
+        An iterator over the result of every chunk, in order.
+    """
+    max_workers = (cpu_count() or 1) if max_workers is None else max_workers
+    if max_workers == 1 or len(chunk_args) == 1:
+        for args in chunk_args:
+            yield chunk_fx(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Keep every worker busy without queueing up every chunk at once
+        pending = deque()
+        try:
+            for args in chunk_args:
+                pending.append(executor.submit(chunk_fx, *args))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Drop the queued chunks when the iterator is closed early
+            for future in pending:
+                future.cancel()
+
+
+def simulate(
+    hand_fx: Callable,
+    n_hands: int,
+    specifications: Union[list, dict] = None,
+    seed: int = None,
+    max_workers: int = None,
+    chunk_size: int = 1000,
+    **kwargs: bool,
+) -> Counter:
+    """Plays hands in worker processes and counts their results.
+
+    For example, the chance of being dealt a pair in two cards:
+
+    from terminal_playing_cards.simulate import simulate
+
+    def is_pair(deck):
+        return deck.pop().face == deck.pop().face
+
+    results = simulate(is_pair, 100_000, seed=42)
+    pair_odds = results[True] / 100_000
+
+    See help(iter_simulation) for a description of the arguments.
+    The results returned by hand_fx must be hashable.
+
+    Returns:
+        A Counter of how many times each hand result occurred.
+    """
+    results = Counter()
+    for chunk_results in iter_simulation(
+        hand_fx,
+        n_hands,
+        specifications=specifications,
+        seed=seed,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        **kwargs,
+    ):
+        results.update(chunk_results)
+    return results
@@ -0,0 +1,321 @@
+"""Precomputed poker hand rank tables, cached on disk between runs"""
+# See terminal_playing_cards/view.py for why these are disabled
+# pylint: disable=missing-docstring
+# pylint: disable=bad-continuation
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections import Counter
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from typing import Iterable
+
+# Poker hand categories, from worst to best. Hand ranks are
+# category << 20 plus up to five tie breaking ranks, four bits each
+HIGH_CARD = 0
+PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+CATEGORY_NAMES = (
+    "high card",
+    "pair",
+    "two pair",
+    "three of a kind",
+    "straight",
+    "flush",
+    "full house",
+    "four of a kind",
+    "straight flush",
+)
+
+# Each rank adds its weight to a hand key. The weights are chosen so
+# that, for hands of a given size, every possible mix of ranks adds up
+# to a different key, which makes the key a perfect hash into the rank
+# tables. The five card weights keep the five card table small.
+RANK_WEIGHTS_5 = (0, 1, 5, 22, 94, 312, 992, 2422, 5624, 12522, 19998, 43258, 79415)
+RANK_WEIGHTS_7 = (
+    0,
+    1,
+    5,
+    22,
+    98,
+    453,
+    2031,
+    8698,
+    22854,
+    83661,
+    262349,
+    636345,
+    1479181,
+)
+# Marks keys that no poker hand adds up to, like five of a kind
+NO_HAND = 0xFFFF
+
+# Bump whenever the layout or contents of the tables change
+TABLES_VERSION = 1
+_MAGIC = b"TPCRANKS"
+_HEADER = struct.Struct("=8s5I8s")
+
+
+def _pack(hand_category: int, ranks: Iterable[int]) -> int:
+    """Packs a category and its tie breaking ranks into a hand rank."""
+    hand_rank = hand_category
+    n_ranks = 0
+    for rank in ranks:
+        hand_rank = (hand_rank << 4) | rank
+        n_ranks += 1
+    return hand_rank << 4 * (5 - n_ranks)
+
+
+def _straight_high(rank_mask: int) -> int:
+    """Highest rank of the best straight in a set of ranks, or -1."""
+    for high in range(12, 3, -1):
+        straight = 0b11111 << (high - 4)
+        if rank_mask & straight == straight:
+            return high
+    # A wheel, ace to five, is a five high straight
+    wheel = 0b1000000001111
+    return 3 if rank_mask & wheel == wheel else -1
+
+
+def _rank_multiset(rank_counts: dict) -> int:
+    """Best rank of a hand with the given rank counts, ignoring flushes."""
+    by_count = sorted(rank_counts.items(), key=lambda item: (item[1], item[0]))
+    by_count.reverse()
+    ranks = sorted(rank_counts, reverse=True)
+    top_rank, top_count = by_count[0]
+    if top_count >= 4:
+        kicker = max(rank for rank in ranks if rank != top_rank)
+        return _pack(FOUR_OF_A_KIND, [top_rank, kicker])
+    if top_count == 3:
+        pairs = [rank for rank, count in by_count[1:] if count >= 2]
+        if pairs:
+            return _pack(FULL_HOUSE, [top_rank, max(pairs)])
+    rank_mask = sum(1 << rank for rank in ranks)
+    straight_high = _straight_high(rank_mask)
+    if straight_high >= 0:
+        return _pack(STRAIGHT, [straight_high])
+    if top_count == 3:
+        kickers = [rank for rank in ranks if rank != top_rank][:2]
+        return _pack(THREE_OF_A_KIND, [top_rank] + kickers)
+    pairs = sorted((rank for rank, count in by_count if count == 2), reverse=True)
+    if len(pairs) >= 2:
+        kicker = max(rank for rank in ranks if rank not in pairs[:2])
+        return _pack(TWO_PAIR, pairs[:2] + [kicker])
+    if pairs:
+        kickers = [rank for rank in ranks if rank != pairs[0]][:3]
+        return _pack(PAIR, pairs + kickers)
+    return _pack(HIGH_CARD, ranks[:5])
+
+
+@lru_cache(maxsize=None)
+def _flush_table() -> tuple:
+    """Maps every set of five or more suited ranks to its best rank."""
+    table = [-1] * (1 << 13)
+    for rank_mask in range(1 << 13):
+        if bin(rank_mask).count("1") < 5:
+            continue
+        straight_high = _straight_high(rank_mask)
+        if straight_high >= 0:
+            table[rank_mask] = _pack(STRAIGHT_FLUSH, [straight_high])
+        else:
+            ranks = [rank for rank in range(12, -1, -1) if rank_mask >> rank & 1]
+            table[rank_mask] = _pack(FLUSH, ranks[:5])
+    return tuple(table)
+
+
+def _rank_mixes(hand_size: int):
+    """Yields the rank counts of every possible poker hand of a size."""
+    for ranks in combinations_with_replacement(range(13), hand_size):
+        rank_counts = Counter(ranks)
+        if max(rank_counts.values()) <= 4:
+            yield rank_counts
+
+
+def _hand_key(weights: tuple, rank_counts: Counter) -> int:
+    """Adds up the weights of the ranks in a hand."""
+    return sum(weights[rank] * count for rank, count in rank_counts.items())
+
+
+def _hash_table(hand_size: int, weights: tuple, ordinals: dict) -> array:
+    """Builds the table from the keys of a hand size to hand ordinals."""
+    max_key = (weights[-1] * 4) + (weights[-2] * (hand_size - 4))
+    table = array("H", [NO_HAND]) * (max_key + 1)
+    for rank_counts in _rank_mixes(hand_size):
+        key = _hand_key(weights, rank_counts)
+        if table[key] != NO_HAND:
+            raise ValueError(f"Rank weights collide for {hand_size} card hands")
+        table[key] = ordinals[_rank_multiset(rank_counts)]
+    return table
+
+
+def build_tables() -> bytes:
+    """Generates the poker rank tables, in the layout they are cached in.
+
+    The tables are, in order: every distinct hand rank from worst to
+    best, so that hands can be looked up as small ordinals; the ordinal
+    of the best flush for every 13 bit mask of suited ranks; and the
+    ordinal of every five and seven card key.
+    """
+    flush_ranks = _flush_table()
+    hand_ranks = {hand_rank for hand_rank in flush_ranks if hand_rank >= 0}
+    hand_ranks.update(_rank_multiset(rank_counts) for rank_counts in _rank_mixes(5))
+    ranks = array("I", sorted(hand_ranks))
+    ordinals = {hand_rank: ordinal for ordinal, hand_rank in enumerate(ranks)}
+    # Fewer than five suited cards make no flush, and lose to any hand
+    flush = array("H", [ordinals.get(hand_rank, 0) for hand_rank in flush_ranks])
+    five = _hash_table(5, RANK_WEIGHTS_5, ordinals)
+    seven = _hash_table(7, RANK_WEIGHTS_7, ordinals)
+
+    header = _HEADER.pack(
+        _MAGIC,
+        TABLES_VERSION,
+        len(ranks),
+        len(flush),
+        len(five),
+        len(seven),
+        sys.byteorder.encode(),
+    )
+    return b"".join(
+        [header, ranks.tobytes(), flush.tobytes(), five.tobytes(), seven.tobytes()]
+    )
+
+
+class _SixCardTable(dict):
+    """The six card rank table, giving NO_HAND for keys of no hand."""
+
+    def __missing__(self, key):
+        return NO_HAND
+
+
+class PokerTables(object):
+    """Poker rank tables read straight out of a buffer, without copying.
+
+    Attributes:
+        buffer: The bytes-like object holding the tables, usually a
+            memory mapped cache file.
+        ranks: Every distinct hand rank, indexed by hand ordinal.
+        flush: The ordinal of the best flush for every mask of suited ranks.
+        five: The ordinal of every five card key. See RANK_WEIGHTS_5.
+        seven: The ordinal of every seven card key. See RANK_WEIGHTS_7.
+        six: A dictionary with the ordinal of every six card key, using
+            RANK_WEIGHTS_7. Built the first time it is used, rather than
+            cached on disk, since six card hands are rare.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError("Poker rank tables are truncated")
+        magic, version, *sizes, byteorder = _HEADER.unpack_from(view)
+        if (magic, version, byteorder.rstrip(b"\0")) != (
+            _MAGIC,
+            TABLES_VERSION,
+            sys.byteorder.encode(),
+        ):
+            raise ValueError("Poker rank tables were built by another version")
+        if len(view) != _HEADER.size + 4 * sizes[0] + 2 * sum(sizes[1:]):
+            raise ValueError("Poker rank tables are truncated")
+
+        start = _HEADER.size
+        sections = []
+        for size, typecode in zip(sizes, "IHHH"):
+            end = start + size * (4 if typecode == "I" else 2)
+            sections.append(view[start:end].cast(typecode))
+            start = end
+        self.ranks, self.flush, self.five, self.seven = sections
+        self._six = None
+
+    @property
+    def six(self) -> dict:
+        if self._six is None:
+            ordinals = {rank: ordinal for ordinal, rank in enumerate(self.ranks)}
+            self._six = _SixCardTable(
+                (
+                    _hand_key(RANK_WEIGHTS_7, rank_counts),
+                    ordinals[_rank_multiset(rank_counts)],
+                )
+                for rank_counts in _rank_mixes(6)
+            )
+        return self._six
+
+
+def default_cache_dir() -> str:
+    """The directory the poker rank tables are cached in.
+
+    Set the TERMINAL_PLAYING_CARDS_CACHE environment variable to choose
+    another directory. Otherwise follows the platform's convention for
+    per-user cache files.
+    """
+    cache_dir = os.environ.get("TERMINAL_PLAYING_CARDS_CACHE")
+    if cache_dir:
+        return cache_dir
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base_dir = os.path.expanduser("~/Library/Caches")
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base_dir, "terminal_playing_cards")
+
+
+def _map_tables(path: str) -> PokerTables:
+    """Memory maps a cache file of poker rank tables."""
+    with open(path, "rb") as tables_file:
+        # The mapping stays valid after the file is closed
+        return PokerTables(
+            mmap.mmap(tables_file.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+
+
+@lru_cache(maxsize=None)
+def load_tables(cache_dir: str = None) -> PokerTables:
+    """Loads the poker rank tables, generating and caching them if needed.
+
+    The first run generates the tables, which takes about a second, and
+    saves them to a file in cache_dir. Every later load, in this or any
+    other process, memory maps that file, so it takes no time and worker
+    processes share the same pages of memory. If the cache cannot be
+    written to, the tables are kept in memory instead.
+
+    Args:
+        cache_dir: Directory to cache the tables in. Defaults to
+            default_cache_dir().
+
+    Returns:
+        A PokerTables object
+    """
+    cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+    path = os.path.join(cache_dir, f"poker_ranks_v{TABLES_VERSION}.bin")
+    try:
+        return _map_tables(path)
+    except (OSError, ValueError):
+        pass
+
+    tables = build_tables()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first, so other processes never
+        # map a half written cache file
+        temp_fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return PokerTables(tables)
+    try:
+        with os.fdopen(temp_fd, "wb") as temp_file:
+            temp_file.write(tables)
+        os.replace(temp_path, path)
+        return _map_tables(path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return PokerTables(tables)
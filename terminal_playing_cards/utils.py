@@ -1,9 +1,46 @@
 """Common utility functions shared across classes"""
 
+import random
+from functools import lru_cache
+from hashlib import sha256
+from typing import Union
+from unicodedata import east_asian_width
+
 
 def convert_layers_to_string(layers: list) -> str:
     """Given Card or View layers, convert the grid layers to a string"""
-    string_conversion = ""
-    for layer in layers:
-        string_conversion += "\n" + "".join(layer)
-    return string_conversion
+    return "".join("\n" + "".join(layer) for layer in layers)
+
+
+@lru_cache(maxsize=4096)
+def text_width(text: str) -> int:
+    """Number of terminal columns a string takes up.
+
+    Wide characters, like many East Asian characters, take up two columns.
+    """
+    return sum(2 if east_asian_width(char) in ("W", "F") else 1 for char in text)
+
+
+def get_rng(rng: Union[int, random.Random] = None):
+    """Given a seed or random.Random, returns a generator to shuffle with.
+
+    Falls back to the random module's global generator when rng is None.
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, int):
+        return random.Random(rng)
+    return rng
+
+
+def spawn_seeds(seed: int, n_seeds: int) -> list:
+    """Derives independent child seeds from one root seed.
+
+    The same root seed always gives the same child seeds, so work spread
+    over several processes, each with its own child seed, can be replayed
+    exactly from the root seed alone.
+    """
+    return [
+        int.from_bytes(sha256(f"{seed}:{child}".encode()).digest()[:8], "big")
+        for child in range(n_seeds)
+    ]
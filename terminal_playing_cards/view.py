@@ -6,9 +6,14 @@
 # according to Google style guide
 # pylint: disable=missing-docstring
 
-from colorama import Style, Fore
+import threading
+from typing import TYPE_CHECKING, Union
+from terminal_playing_cards.ansi import Fore, Style, enable_terminal
+from terminal_playing_cards.backends import AnsiBackend, get_backend
 from terminal_playing_cards.deck import Deck
-from terminal_playing_cards.utils import convert_layers_to_string
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 
 class View(Deck):
@@ -35,8 +40,8 @@ class View(Deck):
             to the terminal. Defaults to "horizontal".
         spacing: How far apart to space the cards when
             printed to the terminal. Negative spacing (placing
-            a card on top of the previous card) is allowed.
-            Defaults to 2.
+            a card on top of the previous card) is allowed, down
+            to -10, or -6 for vertical Views. Defaults to 2.
     """
 
     # No need to initialize Deck when View is created. Only looking to inherit
@@ -44,13 +49,19 @@ class View(Deck):
     # pylint: disable=super-init-not-called
     def __init__(self, cards: list, orientation: str = "horizontal", spacing: int = 2):
         self.cards = cards
+        self.rng = None
+        self._lock = threading.Lock()
         self._orientation = None
-        self.orientation = orientation
         self._spacing = None
+        self.orientation = orientation
         self.spacing = spacing
 
     # pylint: enable=super-init-not-called
 
+    @classmethod
+    def _from_cards(cls, cards: list) -> "View":
+        return cls(cards)
+
     @property
     def orientation(self):
         return self._orientation
@@ -58,6 +69,7 @@ class View(Deck):
     @orientation.setter
     def orientation(self, orientation):
         if orientation in ["horizontal", "vertical"]:
+            self._check_vertical_spacing(orientation, self._spacing)
             self._orientation = orientation
         else:
             raise NotImplementedError(
@@ -71,71 +83,215 @@ class View(Deck):
     @spacing.setter
     def spacing(self, spacing):
         if spacing > -11:
+            self._check_vertical_spacing(self._orientation, spacing)
             self._spacing = spacing
         else:
             raise NotImplementedError(
                 "The View class cannot have spacing less than -10"
             )
 
-    def _merge_horizontal(self) -> list:
-        """Merges all cards in the View horizontally."""
-        merged_grid = []
-        positive_spacing = [" " for _ in range(self._spacing)]
-        # Combine the cards in the View at the grid layer level
-        for layer in range(7):
-            merged_layer = []
-            card_position = 0
-            for card in self:
-                # Need to know if the previous card was hidden or if it had a
-                # long face (like "10" or "JK") in order to know how to handle
-                # negative spacing when merging for the current layer
-                prev_card = (
-                    self[card_position - 1] if card_position != 0 else DummyCard()
+    @staticmethod
+    def _check_vertical_spacing(orientation: str, spacing: int) -> None:
+        """Vertical cards must overlap little enough to show their top row."""
+        if orientation == "vertical" and spacing is not None and spacing < -6:
+            raise NotImplementedError(
+                "The View class cannot stack cards vertically with spacing "
+                "less than -6"
+            )
+
+    def _plan_horizontal(self) -> list:
+        """Works out once, for every card, how it is drawn on each layer.
+
+        Returns a list with a (start, style, prefixes, end, cells_hidden)
+        tuple per card. start and end are the segments drawn before and
+        after the card, if any, and cells_hidden is the number of cells at
+        the end of each layer that are covered by the next card.
+        """
+        card_plans = []
+        last_position = len(self) - 1
+        positive_spacing = " " * self._spacing if self._spacing > 0 else ""
+        border = (Fore.BLACK, "|")
+        no_cells_hidden = (0,) * 7
+        for card_position, card in enumerate(self):
+            # pylint: disable=protected-access
+            card_style = card._get_style()
+            card_prefixes = card._render()[2]
+            # pylint: enable=protected-access
+            if self._spacing >= 0 or card_position == last_position:
+                card_end = (Style.RESET_ALL, positive_spacing)
+                cells_hidden = no_cells_hidden
+            else:
+                # The next card covers the end of this one, starting with its
+                # style reset. Cards with a long face (like "10" or "JK") are
+                # wider, so one more cell is covered on all but the last layer
+                face_is_len_two = len(card.face) == 2 and not card.hidden
+                card_end = None
+                cells_hidden = tuple(
+                    -self._spacing if face_is_len_two and layer != 6
+                    else -self._spacing - 1
+                    for layer in range(7)
                 )
-                # pylint: disable=protected-access
-                card_style = [card._get_style()]
-                # pylint: enable=protected-access
-                card_layer = card_style + card[layer] + [Style.RESET_ALL]
-                if self._spacing >= 0:
-                    merged_layer += card_layer + positive_spacing
-                else:
-                    border = [Fore.BLACK, "|"] if card_position != 0 else []
-                    prev_face_is_len_two = (
-                        len(prev_card.face) == 2 and not prev_card.hidden
-                    )
-                    on_last_layer = layer == 6
-                    negative_spacing = (
-                        self._spacing
-                        if not (prev_face_is_len_two)
-                        or (prev_face_is_len_two and on_last_layer)
-                        else self._spacing - 1
-                    )
-                    merged_layer = merged_layer[:negative_spacing] + border + card_layer
-                    card_position += 1
-            merged_grid.append(merged_layer)
-
-        return merged_grid
-
-    def _merge_vertical(self) -> list:
-        """Merge all cards in the View vertically."""
-        raise NotImplementedError(
-            "Vertical orientation currently not implemented for the View class"
-        )
+            card_start = (
+                border if self._spacing < 0 and card_position != 0 else None
+            )
+            card_plans.append(
+                (card_start, card_style, card_prefixes, card_end, cells_hidden)
+            )
 
-    def __str__(self):
-        """Makes the View look like a collection of playing cards."""
+        return card_plans
+
+    def _merge_horizontal(self):
+        """Merges all cards in the View horizontally, one line at a time.
+
+        Plans every card once and builds each terminal line out of
+        precomputed (escape, text) segments, so rendering is linear in the
+        number of cards.
+        """
+        yield from self._merge_plans(self._plan_horizontal())
+
+    @staticmethod
+    def _merge_plans(card_plans: list):
+        """Builds the segments of each line of a row of planned cards.
+
+        See help(View._plan_horizontal) for the card plans.
+        """
+        for layer in range(7):
+            segments = []
+            for card_start, style, prefixes, card_end, hidden in card_plans:
+                if card_start:
+                    segments.append(card_start)
+                segments.append((style, prefixes[layer][-1 - hidden[layer]]))
+                if card_end:
+                    segments.append(card_end)
+            yield segments
+
+    def _merge_vertical(self):
+        """Merges all cards in the View vertically, one line at a time.
+
+        Stacks the cached rows of every card on top of each other. Positive
+        spacing puts blank lines between the cards, while negative spacing
+        lets each card cover the bottom rows of the card above it, leaving
+        at least the top row with its face and suit showing.
+        """
+        rows_shown = 7 + min(self._spacing, 0)
+        blank_lines = max(self._spacing, 0)
+        last_position = len(self) - 1
+        for card_position, card in enumerate(self):
+            # pylint: disable=protected-access
+            card_style = card._get_style()
+            card_prefixes = card._render()[2]
+            # pylint: enable=protected-access
+            if card_position == last_position:
+                rows_shown = 7
+            for layer in range(rows_shown):
+                yield [(card_style, card_prefixes[layer][-1]), (Style.RESET_ALL, "")]
+            if card_position != last_position:
+                for _ in range(blank_lines):
+                    yield []
+
+    def iter_lines(self, backend: Union[str, AnsiBackend] = None):
+        """Renders the View one terminal line at a time.
+
+        Yields each line as soon as it is built, without the trailing
+        newline, so large Views never need to be held in memory as a
+        whole. For example:
+
+        for line in hand.iter_lines():
+            print(line)
+
+        Args:
+            backend: How to turn the cards into text. Available options
+                are ansi, plain and minimal. See
+                terminal_playing_cards.backends for details. Defaults
+                to ansi.
+        """
+        backend = get_backend(backend)
+        if backend.uses_ansi:
+            enable_terminal()
         merge_fx = getattr(self, f"_merge_{self._orientation}")
         # Merge playing cards in desired direction
-        merged_cards = merge_fx()
-        return convert_layers_to_string(merged_cards)
+        for segments in merge_fx():
+            yield backend.merge(segments)
+
+    def render(self, backend: Union[str, AnsiBackend] = None) -> str:
+        """Renders the View as a string with the given backend.
+
+        Args:
+            backend: How to turn the cards into text. See
+                help(View.iter_lines) for available options.
+
+        Returns:
+            The View as text, just like str(view) but for the backend.
+        """
+        return "".join("\n" + line for line in self.iter_lines(backend))
 
+    async def render_async(
+        self,
+        backend: Union[str, AnsiBackend] = None,
+        executor: "Executor" = None,
+    ) -> str:
+        """Renders the View from within an event loop.
 
-# Dummy object used by View to determine how to merge cards
-# pylint: disable=too-few-public-methods
-class DummyCard:
-    def __init__(self):
-        self.face = " "
-        self.hidden = False
+        Hands control back to the event loop after every line, so
+        rendering a large View does not hold up other tasks. Alternatively,
+        the whole render can be handed off to an executor. For example:
 
+        table_str = await hand.render_async()
 
-# pylint: enable=too-few-public-methods
+        Args:
+            backend: How to turn the cards into text. See
+                help(View.iter_lines) for available options.
+            executor: A thread or process pool executor to render the
+                View in. Defaults to rendering on the event loop.
+
+        Returns:
+            The View as text, just like view.render(backend).
+        """
+        # Only needed here, so importing the package stays cheap
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+
+        if executor is not None:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(executor, self.render, backend)
+
+        lines = []
+        for line in self.iter_lines(backend):
+            lines.append("\n" + line)
+            await asyncio.sleep(0)
+        return "".join(lines)
+
+    def render_to(
+        self,
+        stream,
+        buffer_size: int = 65536,
+        backend: Union[str, AnsiBackend] = None,
+    ) -> None:
+        """Writes the View to a file-like object, line by line.
+
+        Writes exactly what print(view, file=stream) would, collecting
+        lines into writes of about buffer_size characters.
+
+        Args:
+            stream: A text file-like object with a write method,
+                like sys.stdout or an open log file.
+            buffer_size: Number of characters to collect before
+                writing them to the stream. Defaults to 65536.
+            backend: How to turn the cards into text. See
+                help(View.iter_lines) for available options.
+        """
+        buffer = []
+        buffered = 0
+        for line in self.iter_lines(backend):
+            buffer.append("\n" + line)
+            buffered += len(line) + 1
+            if buffered >= buffer_size:
+                stream.write("".join(buffer))
+                buffer = []
+                buffered = 0
+        buffer.append("\n")
+        stream.write("".join(buffer))
+
+    def __str__(self):
+        """Makes the View look like a collection of playing cards."""
+        return self.render()
@@ -0,0 +1,47 @@
+"""Shared test fixtures"""
+
+import os
+from timeit import repeat
+import pytest
+from terminal_playing_cards.tables import load_tables
+
+
+@pytest.fixture(scope="session", autouse=True)
+def poker_tables_cache(tmp_path_factory):
+    """Caches the poker rank tables in a temporary directory
+
+    Keeps the tests from writing the tables into the user's cache directory.
+    Worker processes inherit the environment variable, so they use it too.
+    """
+    cache_dir = str(tmp_path_factory.mktemp("cache"))
+    old_cache_dir = os.environ.get("TERMINAL_PLAYING_CARDS_CACHE")
+    os.environ["TERMINAL_PLAYING_CARDS_CACHE"] = cache_dir
+    load_tables.cache_clear()
+    yield cache_dir
+    load_tables.cache_clear()
+    if old_cache_dir is None:
+        del os.environ["TERMINAL_PLAYING_CARDS_CACHE"]
+    else:
+        os.environ["TERMINAL_PLAYING_CARDS_CACHE"] = old_cache_dir
+
+
+def check_scales_linearly(make_run, sizes: tuple, number: int = 1) -> None:
+    """Checks that the time taken grows about linearly with the size
+
+    make_run(size) sets up a run of the given size and returns a function
+    that runs it. The best time of a few repeats is taken for each size.
+    """
+    small_size, large_size = sizes
+    small, large = (
+        min(repeat(make_run(size), number=number, repeat=3))
+        for size in (small_size, large_size)
+    )
+    # A linear run takes ~8x as long for 8x the size, a quadratic one ~64x
+    size_ratio = large_size / small_size
+    assert large / small < 3 * size_ratio
+
+
+@pytest.fixture
+def assert_scales_linearly():
+    """Regression benchmark helper, see check_scales_linearly"""
+    return check_scales_linearly
@@ -15,7 +15,7 @@ def test_card_str_value():
         "     ♠     \n"
         "           \n"
         "          ♠\n"
-        "          A"
+        "          A\x1b[0m"
     )
     queen_hearts = Card("Q", "hearts")
     queen_hearts_string = (
@@ -26,7 +26,7 @@ def test_card_str_value():
         "     ♛     \n"
         "           \n"
         "          ♥\n"
-        "          Q"
+        "          Q\x1b[0m"
     )
     ten_clubs = Card("10", "clubs")
     ten_clubs_string = (
@@ -37,7 +37,7 @@ def test_card_str_value():
         "            \n"
         "  ♣     ♣   \n"
         "     ♣    ♣ \n"
-        "  ♣     ♣ 10"
+        "  ♣     ♣ 10\x1b[0m"
     )
     joker = Card("JK", "none")
     joker_string = (
@@ -48,7 +48,7 @@ def test_card_str_value():
         "     👹      \n"
         "            \n"
         "            \n"
-        "          JK"
+        "          JK\x1b[0m"
     )
     assert str(ace_spades) == ace_spades_string
     assert str(queen_hearts) == queen_hearts_string
@@ -66,7 +66,7 @@ def test_hidden_card_str_value():
         "||       ||\n"
         "||   🚲   ||\n"
         "||       ||\n"
-        "||       ||"
+        "||       ||\x1b[0m"
     )
     ace_diamonds = Card("A", "diamonds", hidden=True)
     ten_spades = Card("10", "spades", hidden=True)
@@ -89,7 +89,7 @@ def test_face_card_no_picture_str_value():
         "           \n"
         "           \n"
         "          ♥\n"
-        "          Q"
+        "          Q\x1b[0m"
     )
     queen_hearts_no_picture = Card("Q", "hearts", picture=False)
 
@@ -177,3 +177,83 @@ def test_card_throws_good_error_message():
         Card("fake face", "spades")
     with pytest.raises(NotImplementedError):
         Card("A", "fake suit")
+
+
+def test_card_render_is_cached_and_follows_changes():
+    """Cards sharing a look share a render, and a changed card renders anew"""
+    queen_hearts_1 = Card("Q", "hearts")
+    queen_hearts_2 = Card("Q", "hearts", value=12)
+    assert str(queen_hearts_1) is str(queen_hearts_2)
+
+    queen_hearts_2.hidden = True
+    assert str(queen_hearts_2) == str(Card("A", "clubs", hidden=True))
+    queen_hearts_2.hidden = False
+    queen_hearts_2.picture = False
+    assert str(queen_hearts_2) == str(Card("Q", "hearts", picture=False))
+    queen_hearts_2.suit = "spades"
+    assert "♠" in str(queen_hearts_2)
+
+
+def test_card_layers_are_not_shared():
+    """Changing a returned layer does not change the cached render"""
+    ace_spades = Card("A", "spades")
+    first_layer = ace_spades[0]
+    first_layer[0] = "X"
+    assert ace_spades[0][0] == "A"
+
+
+def test_card_render_cache_is_bounded(monkeypatch):
+    """The render cache never grows beyond its maximum size"""
+    from terminal_playing_cards import card
+
+    monkeypatch.setattr(card, "RENDER_CACHE_SIZE", 2)
+    card.clear_render_cache()
+    for face in ["A", "2", "3", "4"]:
+        str(Card(face, "clubs"))
+    assert len(card._RENDER_CACHE) == 2
+    card.clear_render_cache()
+
+
+def test_card_has_no_instance_dict():
+    """Cards use slots and share one canonical face and suit object"""
+    queen_clubs_1 = Card("q", "CLUBS")
+    queen_clubs_2 = Card("".join(["Q"]), "".join(["clu", "bs"]))
+    assert not hasattr(queen_clubs_1, "__dict__")
+    assert queen_clubs_1.face is queen_clubs_2.face
+    assert queen_clubs_1.suit is queen_clubs_2.suit
+    with pytest.raises(AttributeError):
+        queen_clubs_1.color = "black"
+
+
+def test_rebuilding_render_tables_after_config_changes(monkeypatch):
+    """New faces render right away, changed faces after rebuild_tables"""
+    from terminal_playing_cards import card, config
+
+    monkeypatch.setitem(config.CARD_FACE_DICT, "C", {"coords": [(3, 5)]})
+    card.rebuild_tables()
+    assert len(card._RENDER_CACHE) == 15 * 5 * 2 + 2
+    custom_card = Card("C", "spades")
+    assert custom_card[3][5] == "♠"
+
+    monkeypatch.setitem(config.CARD_FACE_DICT, "C", {"coords": [(2, 5)]})
+    assert custom_card[3][5] == "♠"
+    card.rebuild_tables()
+    assert custom_card[3][5] == " "
+    assert custom_card[2][5] == "♠"
+
+    monkeypatch.undo()
+    card.rebuild_tables()
+
+
+def test_card_render_backends():
+    """Cards can be rendered without any escape codes"""
+    ace_spades = Card("A", "spades")
+    assert ace_spades.render("ansi") == str(ace_spades)
+    assert ace_spades.render("minimal") == (
+        "\x1b[30;47m" + ace_spades.render("plain") + "\x1b[0m"
+    )
+    assert ace_spades.render("plain") == (
+        str(ace_spades)[len("\x1b[47m\x1b[30m") : -len("\x1b[0m")]
+    )
+    # Every backend ends the card in the default style
+    assert str(ace_spades).endswith("\x1b[0m")
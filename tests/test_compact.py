@@ -0,0 +1,148 @@
+"""Test the CompactDeck class"""
+
+import pytest
+from terminal_playing_cards.card import Card
+from terminal_playing_cards.compact import CompactDeck
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.view import View
+
+
+def test_compact_deck_matches_deck():
+    """A CompactDeck holds the same cards as a Deck, one byte per card"""
+    compact_deck = CompactDeck()
+    deck = Deck()
+    assert len(compact_deck) == 52
+    assert compact_deck.codes.itemsize == 1
+    assert [repr(card) for card in compact_deck] == [repr(card) for card in deck]
+    assert repr(compact_deck[-1]) == repr(deck[-1])
+    assert [repr(card) for card in compact_deck[:3]] == [
+        repr(card) for card in deck[:3]
+    ]
+
+
+def test_compact_deck_builds_cards_with_options():
+    """Card initialization options are applied to the Cards built"""
+    compact_deck = CompactDeck(specifications={"A": {"spades": 1}}, hidden=True)
+    ace_spades = compact_deck.pop()
+    assert ace_spades.hidden
+    assert ace_spades.value == 1
+    assert len(compact_deck) == 0
+
+
+def test_shuffling_and_sorting_compact_deck():
+    """Shuffle and sort reorder the codes like they reorder a Deck"""
+    compact_deck = CompactDeck()
+    compact_deck.shuffle()
+    compact_deck.sort(sort_order=["suit", "value"], value_order="desc")
+    deck = Deck()
+    deck.sort(sort_order=["suit", "value"], value_order="desc")
+    assert [(card.face, card.suit) for card in compact_deck] == [
+        (card.face, card.suit) for card in deck
+    ]
+
+
+def test_adding_to_compact_deck():
+    """Decks, Views and lists of Cards can be added to a CompactDeck"""
+    compact_deck = CompactDeck()
+    compact_deck += CompactDeck()
+    compact_deck += View([Card("A", "spades"), Card("K", "hearts")])
+    compact_deck += [Card("2", "clubs")]
+    assert len(compact_deck) == 107
+    assert compact_deck[-1].value == 2
+
+    with pytest.raises(NotImplementedError):
+        compact_deck += [Card("JK", "none")]
+    with pytest.raises(NotImplementedError):
+        compact_deck += ["not a card"]
+
+    combined_deck = compact_deck + Deck()
+    assert isinstance(combined_deck, CompactDeck)
+    assert len(combined_deck) == 159
+    assert len(compact_deck) == 107
+
+
+def test_shoe_batch_rows_are_shuffled_decks():
+    """Every row of a ShoeBatch is a permutation of the deck's codes"""
+    import random
+    from terminal_playing_cards.compact import ShoeBatch
+
+    batch = ShoeBatch(100, rng=random.Random(7))
+    assert len(batch) == 100
+    assert len(batch.codes) == 100 * 52
+    assert all(sorted(batch[deck]) == list(range(52)) for deck in range(100))
+    assert len({bytes(batch[deck]) for deck in range(100)}) == 100
+
+    same_seed_batch = ShoeBatch(100, rng=random.Random(7))
+    assert same_seed_batch.codes == batch.codes
+
+
+def test_shoe_batch_deals_hands_from_every_deck():
+    """Dealing takes the next slice of codes off the top of every deck"""
+    from terminal_playing_cards.compact import ShoeBatch
+
+    batch = ShoeBatch(3, specifications=["face_cards_are_ten"])
+    first_hands = batch.deal(2)
+    second_hands = batch.deal(50)
+    assert [list(hand) for hand in first_hands] == [
+        list(batch[deck][:2]) for deck in range(3)
+    ]
+    assert [len(hand) for hand in second_hands] == [50, 50, 50]
+    assert batch.remaining == 0
+    assert sum(batch.table.values[code] for code in batch[0]) == 340
+    with pytest.raises(IndexError):
+        batch.deal(1)
+
+
+def test_shoe_batch_shuffles_decks_as_deep_as_dealt():
+    """Dealing in several steps gives the same decks as shuffling them all"""
+    from terminal_playing_cards.compact import ShoeBatch
+
+    batch = ShoeBatch(20, rng=11)
+    first_hands = [bytes(hand) for hand in batch.deal(2)]
+    batch.deal(30)
+    # Shuffling further down never moves the cards already dealt
+    assert [bytes(batch[deck][:2]) for deck in range(20)] == first_hands
+    assert batch.codes == ShoeBatch(20, rng=11).codes
+    assert all(sorted(batch[deck]) == list(range(52)) for deck in range(20))
+
+
+def test_shoe_batch_deals_faster_than_shuffling_each_deck():
+    """Regression benchmark: dealing a few cards beats shuffling every deck"""
+    import random
+    from timeit import repeat
+    from terminal_playing_cards.compact import ShoeBatch
+
+    def shuffle_each_deck():
+        shuffle_fx = random.Random(1).shuffle
+        row = list(range(52))
+        for _ in range(5_000):
+            shuffle_fx(row)
+
+    loop_time = min(repeat(shuffle_each_deck, number=1, repeat=3))
+    deal_time = min(repeat(lambda: ShoeBatch(5_000, rng=1).deal(2), number=1, repeat=3))
+    full_time = min(repeat(lambda: ShoeBatch(5_000, rng=1).codes, number=1, repeat=3))
+    # Dealing two cards takes about a tenth as long, and shuffling every
+    # deck all the way down about as long as the loop
+    assert deal_time < loop_time / 3
+    assert full_time < 2 * loop_time
+
+
+def test_dealing_from_compact_deck():
+    """Dealing decodes the top codes into a View of Cards"""
+    compact_deck = CompactDeck(picture=False)
+    hand = compact_deck.deal(3)
+    assert isinstance(hand, View)
+    assert [(card.face, card.suit) for card in hand] == [
+        ("A", "clubs"),
+        ("A", "diamonds"),
+        ("A", "spades"),
+    ]
+    assert not hand[0].picture
+    assert len(compact_deck) == 49
+
+
+def test_compact_shoe_of_decks():
+    """A CompactDeck can hold several decks"""
+    shoe = CompactDeck(n_decks=6)
+    assert len(shoe) == 312
+    assert shoe.codes[52:104] == shoe.codes[:52]
@@ -87,3 +87,406 @@ def test_shuffling_deck():
             for original, shuffled in zip(original_order, shuffled_order)
         ]
     )
+
+
+def test_sorting_deck_by_value_then_suit():
+    """A shuffled Deck sorts back into suit order, by value within each suit"""
+    deck = Deck()
+    deck.shuffle()
+    deck.sort()
+    suit_order = ["clubs", "diamonds", "spades", "hearts"]
+    assert [card.suit for card in deck] == [
+        suit for suit in suit_order for _ in range(13)
+    ]
+    for suit_start in range(0, 52, 13):
+        suit_values = [card.value for card in deck[suit_start : suit_start + 13]]
+        assert suit_values == sorted(suit_values)
+
+
+def test_deck_build_validates_specifications():
+    """Deck specifications with unknown faces or suits are rejected"""
+    with pytest.raises(NotImplementedError):
+        Deck(specifications={"A": {"fake suit": 1}})
+    with pytest.raises(NotImplementedError):
+        Deck(specifications={"fake face": {"spades": 1}})
+    deck = Deck(specifications={"q": {"HEARTS": 12}})
+    assert (deck[0].face, deck[0].suit) == ("Q", "hearts")
+
+
+def test_shuffling_deck_is_reproducible_with_a_seed():
+    """Decks shuffled with the same seed end up in the same order"""
+    import random
+
+    deck_1 = Deck(rng=2019)
+    deck_2 = Deck(rng=random.Random(2019))
+    deck_3 = Deck()
+    deck_1.shuffle()
+    deck_2.shuffle()
+    deck_3.shuffle(rng=2019)
+    order_1 = [(card.face, card.suit) for card in deck_1]
+    assert order_1 == [(card.face, card.suit) for card in deck_2]
+    assert order_1 == [(card.face, card.suit) for card in deck_3]
+
+
+def test_spawned_seeds_are_independent_and_replayable():
+    """Child seeds are the same for a root seed and differ between children"""
+    from terminal_playing_cards.utils import spawn_seeds
+
+    child_seeds = spawn_seeds(42, 32)
+    assert child_seeds == spawn_seeds(42, 32)
+    assert len(set(child_seeds)) == 32
+    assert spawn_seeds(43, 1)[0] not in child_seeds
+
+    deck_orders = []
+    for child_seed in child_seeds[:2]:
+        deck = Deck(rng=child_seed)
+        deck.shuffle()
+        deck_orders.append([(card.face, card.suit) for card in deck])
+    assert deck_orders[0] != deck_orders[1]
+
+
+def test_dealing_deck_async():
+    """Cards are dealt off the top while other tasks keep running"""
+    import asyncio
+
+    deck = Deck()
+    top_cards = [(card.face, card.suit) for card in deck[:5]]
+
+    async def deal_with_other_task():
+        ticks = []
+
+        async def other_table():
+            for tick in range(3):
+                ticks.append(tick)
+                await asyncio.sleep(0)
+
+        other_task = asyncio.ensure_future(other_table())
+        dealt = [card async for card in deck.deal_async(5, chunk_size=1)]
+        await other_task
+        return dealt, ticks
+
+    loop = asyncio.new_event_loop()
+    dealt, ticks = loop.run_until_complete(deal_with_other_task())
+    loop.close()
+    assert [(card.face, card.suit) for card in dealt] == top_cards
+    assert len(deck) == 47
+    assert ticks == [0, 1, 2]
+
+
+def test_nested_iteration_over_deck():
+    """Looping over a Deck inside a loop over the same Deck sees every Card"""
+    deck = Deck(specifications={"A": {"clubs": 1, "hearts": 1, "spades": 1}})
+    pairs = [(outer.suit, inner.suit) for outer in deck for inner in deck]
+    assert len(pairs) == 9
+
+
+def test_dealing_hands_from_deck():
+    """Dealing takes Views of Cards off the top of the Deck"""
+    from terminal_playing_cards import View
+
+    deck = Deck()
+    top_cards = [(card.face, card.suit) for card in deck[:5]]
+    hand = deck.deal(5)
+    assert isinstance(hand, View)
+    assert [(card.face, card.suit) for card in hand] == top_cards
+    assert len(deck) == 47
+    with pytest.raises(IndexError):
+        deck.deal(48)
+    assert len(deck) == 47
+    with pytest.raises(IndexError):
+        deck.deal(-3)
+    assert len(deck) == 47
+    assert [(card.face, card.suit) for card in deck.deal(47)] == [
+        (card.face, card.suit) for card in Deck()[5:]
+    ]
+
+
+def test_dealing_from_shared_deck_across_threads():
+    """Stress test: threads sharing a shoe never lose or repeat a Card"""
+    import sys
+    import threading
+
+    shoe = Deck()
+    for _ in range(7):
+        shoe += Deck()
+    hands = []
+
+    def dealer():
+        while True:
+            try:
+                hands.append(shoe.deal(4))
+            except IndexError:
+                return
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=dealer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    dealt_cards = [card for hand in hands for card in hand]
+    assert len(hands) == 104
+    assert len(dealt_cards) == 416
+    assert len({id(card) for card in dealt_cards}) == 416
+    assert len(shoe) == 0
+
+
+def test_popping_from_shared_deck_across_threads():
+    """Stress test: threads popping from a shoe never lose or repeat a Card"""
+    import sys
+    import threading
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(30):
+            shoe = Deck(n_decks=8)
+            popped = []
+
+            def popper():
+                while True:
+                    try:
+                        popped.append(shoe.pop())
+                    except IndexError:
+                        return
+                    # Reading the Cards drops the dealt ones, so it must
+                    # not race with popping either
+                    len(shoe.cards)
+
+            threads = [threading.Thread(target=popper) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(popped) == 416
+            assert len({id(card) for card in popped}) == 416
+            assert len(shoe) == 0
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_dealing_from_top_keeps_deck_consistent():
+    """Cards dealt off the top are gone from every way of looking at the Deck"""
+    deck = Deck()
+    expected_cards = list(deck)
+    for _ in range(10):
+        deck.pop()
+    del expected_cards[:10]
+    assert len(deck) == 42
+    assert list(deck) == expected_cards
+    assert deck[0] is expected_cards[0]
+    assert deck[-1] is expected_cards[-1]
+    assert deck[5:2:-1] == expected_cards[5:2:-1]
+    assert deck[40:] == expected_cards[40:]
+    assert deck.cards == expected_cards
+    with pytest.raises(IndexError):
+        deck[42]
+
+
+def test_dealing_whole_shoe_scales_linearly(assert_scales_linearly):
+    """Regression benchmark: dealing every Card off the top is O(1) per Card"""
+
+    def deal_shoe(n_decks):
+        def deal_everything():
+            shoe = Deck()
+            for _ in range(n_decks - 1):
+                shoe += Deck()
+            while shoe:
+                shoe.pop()
+
+        return deal_everything
+
+    assert_scales_linearly(deal_shoe, (10, 80))
+
+
+def test_adding_decks_makes_a_new_deck():
+    """Adding leaves both sides alone, adding in place extends the Deck"""
+    from terminal_playing_cards import View
+
+    deck_1 = Deck()
+    deck_2 = Deck()
+    combined_deck = deck_1 + deck_2
+    assert len(deck_1) == 52
+    assert len(combined_deck) == 104
+    assert combined_deck[52] is deck_2[0]
+
+    deck_1 += deck_1
+    assert len(deck_1) == 104
+
+    hand = View(deck_2[:2], spacing=-5)
+    bigger_hand = hand + deck_2[2:4]
+    assert isinstance(bigger_hand, View)
+    assert bigger_hand.spacing == -5
+    assert len(hand) == 2
+
+
+def test_concatenating_decks():
+    """Concatenating stacks Decks, Views and lists of Cards in order"""
+    from terminal_playing_cards import Card, View
+
+    joker = Card("JK", "none")
+    shoe = Deck.concat(Deck(), View(Deck()[:3]), [joker])
+    assert len(shoe) == 56
+    assert shoe[-1] is joker
+    assert isinstance(View.concat([joker], [joker]), View)
+    with pytest.raises(NotImplementedError):
+        Deck.concat(Deck(), [joker, "not a card"])
+
+
+def test_deck_views_share_cards():
+    """A View of a Deck shows its Cards without copying them"""
+    from terminal_playing_cards import View
+
+    deck = Deck()
+    peek = deck.view(0, 5)
+    assert isinstance(peek, View)
+    assert len(peek) == 5
+    assert peek[0] is deck[0]
+    assert list(peek) == deck[:5]
+    assert str(peek) == str(View(deck[:5]))
+
+    deck.pop()
+    assert peek[0] is deck[0]
+    assert deck.view(50)[:] == deck[50:]
+
+    # Reading the Cards of the View does not copy them out of the Deck
+    assert peek.cards == deck[:5]
+    deck.pop()
+    assert peek[0] is deck[0]
+
+    # Changing the View leaves the Deck alone
+    peek.sort(sort_order=["value"], value_order="desc")
+    peek.pop()
+    assert len(peek) == 4
+    assert len(deck) == 50
+    shuffled = deck.view(0, 10)
+    shuffled.shuffle(rng=1)
+    assert sorted(shuffled) == sorted(deck[:10])
+    assert shuffled[:] != deck[:10]
+
+
+def test_deck_specifications_do_not_leak_between_decks():
+    """Built-in specifications only change the Deck they are given to"""
+    from terminal_playing_cards.config import DEFAULT_DECK_SPEC
+
+    Deck(specifications=["ace_high", "face_cards_are_ten"])
+    assert DEFAULT_DECK_SPEC["A"]["spades"] == 1
+    assert DEFAULT_DECK_SPEC["K"]["spades"] == 13
+    assert Deck()[0].value == 1
+
+
+def test_clearing_spec_cache_picks_up_config_changes(monkeypatch):
+    """Changes to the default spec are used once the spec cache is cleared"""
+    from terminal_playing_cards import clear_spec_cache
+    from terminal_playing_cards.config import DEFAULT_DECK_SPEC
+
+    assert Deck()[0].value == 1
+    monkeypatch.setitem(DEFAULT_DECK_SPEC, "A", dict(DEFAULT_DECK_SPEC["A"]))
+    DEFAULT_DECK_SPEC["A"]["clubs"] = 99
+    clear_spec_cache()
+    assert Deck()[0].value == 99
+    assert Deck(specifications=["ace_high"])[0].value == 14
+    monkeypatch.undo()
+    clear_spec_cache()
+    assert Deck()[0].value == 1
+
+
+def test_unhashable_specifications_are_compiled_uncached():
+    """Card values that cannot be hashed still build a Deck"""
+    from terminal_playing_cards.deck import compile_spec
+
+    deck = Deck(specifications={"A": {"clubs": [1, 11]}})
+    assert deck[0].value == [1, 11]
+    assert compile_spec({"A": {"clubs": [1, 11]}}) == (("A", "clubs", [1, 11]),)
+
+
+def test_empty_specifications_build_default_deck():
+    """An empty specification dictionary builds the standard 52 card deck"""
+    assert Deck(specifications={}).cards == Deck().cards
+    assert len(Deck(specifications={})) == 52
+
+
+def test_equal_values_of_different_types_are_cached_apart():
+    """Card values keep their type even when an equal value was compiled"""
+    for value in (1, 1.0, True):
+        deck = Deck(specifications={"A": {"clubs": value}})
+        assert type(deck[0].value) is type(value)
+
+
+def test_compiled_specifications_are_cached():
+    """Compiling the same specifications again gives the same spec"""
+    from terminal_playing_cards.deck import compile_spec
+
+    spec = compile_spec(["face_cards_are_ten", "ace_high"])
+    assert spec is compile_spec(["ace_high", "face_cards_are_ten"])
+    assert spec[0] == ("A", "clubs", 14)
+    assert spec[-1] == ("K", "hearts", 10)
+    assert hash(spec) == hash(compile_spec(["ace_high", "face_cards_are_ten"]))
+    assert compile_spec({"q": {"HEARTS": 12}}) == (("Q", "hearts", 12),)
+    assert compile_spec() is compile_spec([])
+
+    # Every Deck still gets Cards of its own
+    deck_1 = Deck()
+    deck_2 = Deck()
+    deck_1[0].hidden = True
+    assert deck_1[0] is not deck_2[0]
+    assert not deck_2[0].hidden
+
+
+def test_building_a_shoe_of_decks():
+    """A shoe of several decks remembers which deck each Card came from"""
+    shoe = Deck(n_decks=3, rng=7)
+    assert len(shoe) == 156
+    assert list(shoe.origins) == [0] * 52 + [1] * 52 + [2] * 52
+    assert shoe[0] is not shoe[52]
+    assert (shoe[0].face, shoe[0].suit) == (shoe[52].face, shoe[52].suit)
+    assert Deck().origins is None
+
+    # The origins follow the Cards around
+    first_king = shoe[51]
+    shoe.shuffle()
+    assert sorted(shoe.origins) == [0] * 52 + [1] * 52 + [2] * 52
+    assert shoe.origins[shoe.cards.index(first_king)] == 0
+    shoe.sort(sort_order=["value"])
+    assert shoe.origins[shoe.cards.index(first_king)] == 0
+    hand = shoe.deal(3)
+    assert len(hand.origins) == 3
+    shoe.pop()
+    last_card = shoe.pop(-1)
+    assert len(shoe.origins) == len(shoe) == 151
+
+    shoe += [last_card]
+    assert shoe.origins[-1] == 0
+    shoe += hand
+    assert len(shoe.origins) == len(shoe) == 155
+    assert (shoe + Deck()).origins[-52:] == Deck(n_decks=2).origins[:52]
+
+
+def test_adding_a_shoe_keeps_origins():
+    """Origins survive adding a shoe to a View of a Deck, or to the Cards"""
+    peek = Deck().view(0, 3)
+    peek += Deck(n_decks=2)
+    assert list(peek.origins) == [0] * 55 + [1] * 52
+
+    shoe = Deck(n_decks=2)
+    shoe.pop()
+    shoe.cards += Deck()[:2]
+    assert list(shoe.origins) == [0] * 51 + [1] * 52 + [0] * 2
+    shoe.cards = shoe[:10]
+    assert shoe.origins is None
+
+
+def test_shuffling_a_shoe_matches_shuffling_a_deck():
+    """Keeping track of origins does not change how a shoe is shuffled"""
+    shoe = Deck(n_decks=2)
+    stacked_decks = Deck() + Deck()
+    shoe.shuffle(rng=99)
+    stacked_decks.shuffle(rng=99)
+    assert [(card.face, card.suit) for card in shoe] == [
+        (card.face, card.suit) for card in stacked_decks
+    ]
@@ -0,0 +1,148 @@
+"""Test the poker equity calculator"""
+
+from array import array
+from itertools import combinations
+import pytest
+from terminal_playing_cards.card import Card
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.equity import equity, iter_equity
+from terminal_playing_cards.eval import HandEvaluator
+from terminal_playing_cards.view import View
+
+
+def cards(hand: str) -> list:
+    """Builds Cards given like "AS KH 10D" """
+    suits = {"C": "clubs", "D": "diamonds", "S": "spades", "H": "hearts"}
+    return [Card(card[:-1], suits[card[-1]]) for card in hand.split()]
+
+
+def test_finished_board_has_one_winner():
+    """With the whole board dealt, the best hand wins the whole pot"""
+    result = equity(
+        [cards("AS AH"), cards("KS KH")], board=cards("2C 7D 9S JH KD"), max_workers=1
+    )
+    assert result.exact and result.done
+    assert result.n_boards == 1
+    assert result.equity == [0.0, 1.0]
+    assert result.margin == 0.0
+
+
+def test_tied_hands_split_the_pot():
+    """Players who both play the board share the pot"""
+    result = equity(
+        [cards("2C 3D"), cards("2D 3C"), cards("4H 4S")],
+        board=cards("10H JH QH KH AH"),
+        max_workers=1,
+    )
+    assert result.equity == [1 / 3, 1 / 3, 1 / 3]
+    assert result.ties == [1 / 3, 1 / 3, 1 / 3]
+
+
+def test_exact_equity_matches_every_river():
+    """Equity on the turn is the share of the rivers each player wins"""
+    hands = [cards("AS KS"), cards("QD QC")]
+    board = cards("2S 7S QH 3D")
+    evaluator = HandEvaluator()
+    known = evaluator.encode(hands + [board])
+    wins = [0, 0]
+    for river in set(range(52)) - {code for hand in known for code in hand}:
+        hand_ranks = [
+            evaluator.poker_ranks([hand + known[2] + array("B", [river])])[0]
+            for hand in known[:2]
+        ]
+        wins[hand_ranks.index(max(hand_ranks))] += 1
+    result = equity(hands, board=board, max_workers=1)
+    assert result.exact
+    assert result.n_boards == 44
+    assert result.wins == wins
+
+
+def test_equity_only_deals_from_the_deck():
+    """Cards taken out of the Deck are never dealt to the board"""
+    deck = Deck()
+    player_1 = View([deck.pop(index) for index in [0, 4]])
+    player_2 = View([deck.pop(index) for index in [8, 12]])
+    for _ in range(10):
+        deck.pop()
+    flop = deck.deal(3)
+    result = equity([player_1, player_2], deck=deck, board=flop, max_workers=1)
+    assert result.n_boards == len(list(combinations(range(len(deck)), 2)))
+
+    # Known cards left in the Deck are taken out of it
+    full_deck_result = equity([player_1, player_2], board=flop, max_workers=1)
+    assert full_deck_result.n_boards == len(list(combinations(range(45), 2)))
+
+
+def test_sampled_equity_stops_at_the_margin():
+    """Boards are sampled until the equity is known well enough"""
+    results = list(
+        iter_equity(
+            [cards("AS AH"), cards("KS KH")],
+            margin=0.01,
+            seed=42,
+            chunk_size=500,
+            max_workers=1,
+        )
+    )
+    assert len(results) > 1
+    assert [result.n_boards for result in results] == [
+        500 * chunk for chunk in range(1, len(results) + 1)
+    ]
+    final_result = results[-1]
+    assert final_result.done and not final_result.exact
+    assert final_result.margin <= 0.01
+    assert not any(result.done for result in results[:-1])
+    # Pocket aces beat pocket kings about 82.6% of the time
+    assert final_result.equity[0] == pytest.approx(0.826, abs=0.03)
+    assert sum(final_result.equity) == pytest.approx(1)
+
+
+def test_sampled_equity_is_reproducible_across_workers():
+    """The same seed gives the same equity in one or several processes"""
+    hands = [cards("JS 10S"), cards("8D 8C"), cards("AH 5D")]
+    single_process = equity(
+        hands, margin=0, max_samples=2_000, seed=7, chunk_size=500, max_workers=1
+    )
+    worker_pool = equity(
+        hands, margin=0, max_samples=2_000, seed=7, chunk_size=500, max_workers=2
+    )
+    assert single_process.n_boards == 2_000
+    assert single_process.wins == worker_pool.wins
+    assert single_process.ties == worker_pool.ties
+
+
+def test_equity_rejects_impossible_boards():
+    """Boards that cannot be finished from the deck are rejected"""
+    with pytest.raises(NotImplementedError):
+        equity([cards("AS AH"), cards("KS KH")], deck=cards("2C 3C"))
+    with pytest.raises(NotImplementedError):
+        equity([cards("AS AH"), cards("KS KH")], confidence=1.5, max_boards=0)
+    with pytest.raises(NotImplementedError):
+        equity([cards("AS AH"), cards("KS KH")], max_boards=0, max_samples=0)
+
+
+def test_equity_rejects_duplicate_cards():
+    """A card cannot be dealt to two players, or to a player and the board"""
+    with pytest.raises(NotImplementedError):
+        equity([cards("AS AH"), cards("AS KH")])
+    with pytest.raises(NotImplementedError):
+        equity([cards("AS AH"), cards("KS KH")], board=cards("2C 7D AH"))
+
+
+def test_exact_equity_plays_every_board_once_in_chunks():
+    """Splitting the boards into chunks plays each possible board exactly once"""
+    hands = [cards("AS KS"), cards("QD QC")]
+    board = cards("2S 7S QH")
+    whole = equity(hands, board=board, max_workers=1, chunk_size=10_000)
+    assert whole.n_boards == 990
+    for chunk_size in [1, 7, 44, 100]:
+        results = list(
+            iter_equity(hands, board=board, max_workers=1, chunk_size=chunk_size)
+        )
+        assert all(
+            later.n_boards - earlier.n_boards <= chunk_size
+            for earlier, later in zip(results, results[1:])
+        )
+        assert results[-1].n_boards == 990
+        assert results[-1].wins == whole.wins
+        assert results[-1].ties == whole.ties
@@ -0,0 +1,133 @@
+"""Test the HandEvaluator class"""
+
+import random
+from array import array
+from itertools import combinations
+import pytest
+from terminal_playing_cards.card import Card
+from terminal_playing_cards.compact import CardTable, ShoeBatch
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.eval import HandEvaluator, category, split_hands
+from terminal_playing_cards.view import View
+
+
+@pytest.fixture
+def evaluator():
+    """HandEvaluator for a standard 52 card deck"""
+    return HandEvaluator()
+
+
+def poker_hand(evaluator, cards):
+    """Encodes cards given like "AS KH 10D" as a hand of card codes"""
+    suits = {"C": "clubs", "D": "diamonds", "S": "spades", "H": "hearts"}
+    return evaluator.encode(
+        [[Card(card[:-1], suits[card[-1]]) for card in cards.split()]]
+    )[0]
+
+
+def test_totals_match_adding_up_cards():
+    """Hand totals are the same as adding up the Cards"""
+    table = CardTable(Deck._get_spec_dict(["face_cards_are_ten"]))
+    batch = ShoeBatch(200, specifications=["face_cards_are_ten"], rng=3)
+    evaluator = HandEvaluator(table)
+    hands = batch.deal(3)
+    totals = evaluator.totals(hands)
+    assert list(totals) == [
+        sum(View([table.decode(code) for code in hand])) for hand in hands
+    ]
+
+
+def test_blackjack_totals_count_aces_high_unless_they_bust(evaluator):
+    """Aces count eleven when the hand can afford it, and one otherwise"""
+    hands = evaluator.encode(
+        [
+            [Card("A", "spades"), Card("K", "hearts")],
+            [Card("A", "spades"), Card("6", "hearts")],
+            [Card("A", "spades"), Card("A", "hearts"), Card("9", "clubs")],
+            [Card("A", "spades"), Card("6", "hearts"), Card("9", "clubs")],
+            [Card("Q", "spades"), Card("J", "hearts"), Card("2", "clubs")],
+        ]
+    )
+    points, soft = evaluator.blackjack_totals(hands)
+    assert list(points) == [21, 17, 21, 16, 22]
+    assert list(soft) == [1, 1, 1, 0, 0]
+
+
+def test_poker_ranks_order_hands(evaluator):
+    """Better poker hands get higher ranks"""
+    hands_worst_to_best = [
+        "2C 3D 5S 7H 9C",
+        "AC KD QS JH 9C",
+        "2C 2D 5S 7H 9C",
+        "2C 2D 5S 5H 9C",
+        "2C 2D 5S 5H KC",
+        "2C 2D 2S 7H 9C",
+        "AC 2D 3S 4H 5C",
+        "2C 3D 4S 5H 6C",
+        "10C JD QS KH AC",
+        "2H 3H 5H 7H 9H",
+        "2C 2D 2S 9H 9C",
+        "3C 3D 3S 2H 2C",
+        "2C 2D 2S 2H 3C",
+        "AH 2H 3H 4H 5H",
+        "10H JH QH KH AH",
+    ]
+    hand_ranks = evaluator.poker_ranks(
+        [poker_hand(evaluator, hand) for hand in hands_worst_to_best]
+    )
+    assert list(hand_ranks) == sorted(set(hand_ranks))
+    assert [category(hand_rank) for hand_rank in hand_ranks[-3:]] == [
+        "four of a kind",
+        "straight flush",
+        "straight flush",
+    ]
+    # Suits never break ties
+    same_ranks = [
+        poker_hand(evaluator, "AC KD QS JH 9C"),
+        poker_hand(evaluator, "AD KS QH JC 9D"),
+    ]
+    assert evaluator.poker_ranks(same_ranks).tolist() == [hand_ranks[1]] * 2
+
+
+def test_poker_ranks_pick_the_best_five_cards(evaluator):
+    """Six and seven card hands rank as their best five card hand"""
+    rng = random.Random(11)
+    hands = [array("B", rng.sample(range(52), 7)) for _ in range(300)]
+    hands += [hand[:6] for hand in hands[:100]]
+    for hand, hand_rank in zip(hands, evaluator.poker_ranks(hands)):
+        five_card_hands = [array("B", cards) for cards in combinations(hand, 5)]
+        assert hand_rank == max(evaluator.poker_ranks(five_card_hands))
+
+
+def test_evaluating_batches_of_dealt_hands(evaluator):
+    """Hands dealt by a ShoeBatch or split from a buffer can be evaluated"""
+    batch = ShoeBatch(50, rng=5)
+    dealt = evaluator.poker_ranks(batch.deal(5))
+    split = evaluator.poker_ranks(
+        hand[:5] for hand in split_hands(batch.codes, batch.deck_size)
+    )
+    assert dealt == split
+    assert len(dealt) == 50
+
+
+def test_poker_ranks_reject_hands_they_cannot_rank(evaluator):
+    """Poker needs a standard deck and five to seven cards per hand"""
+    with pytest.raises(NotImplementedError):
+        evaluator.poker_ranks([array("B", [0, 1, 2, 3])])
+    with pytest.raises(NotImplementedError):
+        HandEvaluator(CardTable({"JK": {"none": 0}})).poker_ranks([array("B", [0] * 5)])
+
+
+def test_showdown_ranks_every_player_on_every_board(evaluator):
+    """A showdown ranks each player's hole cards together with each board"""
+    rng = random.Random(4)
+    codes = rng.sample(range(52), 14)
+    holes = [array("B", codes[:2]), array("B", codes[2:4])]
+    boards = [array("B", codes[4:9]), array("B", codes[9:14]), codes[9:12]]
+    showdown = list(evaluator.showdown(holes, boards))
+    assert showdown == [
+        list(evaluator.poker_ranks([hole + array("B", board) for hole in holes]))
+        for board in boards
+    ]
+    with pytest.raises(NotImplementedError):
+        list(evaluator.showdown([holes[0], codes[:3]], boards))
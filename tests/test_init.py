@@ -0,0 +1,71 @@
+"""Test importing the package"""
+
+import subprocess
+import sys
+
+
+def run_in_new_process(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Runs python code in a fresh interpreter, as a worker process would"""
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def test_import_does_not_set_up_terminal():
+    """Importing the package neither imports colorama nor wraps stdout"""
+    result = run_in_new_process(
+        "import sys; stdout = sys.stdout\n"
+        "from terminal_playing_cards import Deck\n"
+        "print('colorama' in sys.modules, sys.stdout is stdout)"
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_import_does_not_load_optional_modules():
+    """Modules only needed by a few methods are imported when first used"""
+    result = run_in_new_process(
+        "import sys\n"
+        "import terminal_playing_cards\n"
+        "print(*(module in sys.modules for module in ['asyncio', 'colorama']))"
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_printing_sets_up_terminal():
+    """The terminal is set up the first time a card is printed"""
+    result = run_in_new_process(
+        "import sys\n"
+        "from terminal_playing_cards import Deck, View\n"
+        "hand = View(Deck()[:2])\n"
+        "str(hand)\n"
+        "print('colorama' in sys.modules)"
+    )
+    assert result.stdout.split() == ["True"]
+
+
+def test_import_time_benchmark():
+    """Importing the package stays cheap for short-lived worker processes"""
+    from timeit import repeat
+
+    def best_start_time(code):
+        return min(repeat(lambda: run_in_new_process(code), number=1, repeat=7))
+
+    bare, package = best_start_time("pass"), best_start_time(
+        "import terminal_playing_cards"
+    )
+    # About 4x as long as a bare interpreter start, importing asyncio
+    # along with the package takes about 6x as long
+    assert package / bare < 5
+
+
+def test_first_printed_card_ends_in_default_style():
+    """Text printed after the first card is not colored like the card"""
+    result = run_in_new_process(
+        "from terminal_playing_cards import Card\n"
+        "print(Card('A', 'spades'), end='')"
+    )
+    assert result.stdout.endswith("\x1b[0m")
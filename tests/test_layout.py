@@ -0,0 +1,54 @@
+"""Test the WrappedView class"""
+
+from terminal_playing_cards.card import Card
+from terminal_playing_cards.deck import Deck
+from terminal_playing_cards.layout import WrappedView
+from terminal_playing_cards.utils import text_width
+from terminal_playing_cards.view import View
+
+
+def test_wide_enough_wrapped_view_matches_view():
+    """With room for every card, a WrappedView prints just like a View"""
+    cards = Deck().cards + [Card("JK", "none")]
+    for spacing in [-10, -5, -1, 0, 2]:
+        wrapped_view = WrappedView(cards, spacing=spacing, width=10_000)
+        assert str(wrapped_view) == str(View(cards, spacing=spacing))
+
+
+def test_wrapped_view_rows_fit_the_width():
+    """Cards are wrapped into rows no wider than the width, keeping their order"""
+    cards = Deck().cards + [Card("10", "hearts"), Card("JK", "none")]
+    for spacing in [-8, -5, 0, 3]:
+        wrapped_view = WrappedView(cards, spacing=spacing, width=80)
+        lines = wrapped_view.render("plain").split("\n")[1:]
+        assert max(text_width(line) for line in lines) <= 80
+        # Rows are 7 lines each, with a blank line in between
+        assert (len(lines) + 1) % 8 == 0
+        # The top left corner of every card shows its face
+        faces = [
+            face
+            for row_start in range(0, len(lines), 8)
+            for face in lines[row_start].replace("|", " ").split()
+            if face not in ("♦", "♥", "♣", "♠")
+        ]
+        assert faces == [card.face for card in cards]
+        assert len(lines) > 7
+
+
+def test_narrow_wrapped_view_puts_each_card_on_its_own_row():
+    """A card wider than the width still gets printed, on a row of its own"""
+    cards = Deck().cards[:3]
+    wrapped_view = WrappedView(cards, spacing=-5, width=5, row_spacing=0)
+    assert wrapped_view.render("plain") == "".join(
+        card.render("plain") for card in cards
+    )
+
+
+def test_wrapped_view_render_scales_linearly(assert_scales_linearly):
+    """Regression benchmark: wrapped rendering time grows linearly with card count"""
+
+    def render_shoe(n_decks):
+        shoe = WrappedView(Deck(n_decks=n_decks).cards, spacing=-5, width=120)
+        return lambda: str(shoe)
+
+    assert_scales_linearly(render_shoe, (1, 8), number=5)
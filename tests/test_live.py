@@ -0,0 +1,74 @@
+"""Test the LiveTable class"""
+
+import re
+from unicodedata import east_asian_width
+from terminal_playing_cards.card import Card
+from terminal_playing_cards.live import LiveTable
+from terminal_playing_cards.view import View
+
+
+def apply_to_screen(screen: dict, updates: str) -> dict:
+    """Plays updates onto a screen of {(row, column): character}"""
+    row = column = 1
+    cursor_moves = r"\x1b\[(\d+;\d+)H|((?:(?!\x1b\[\d+;\d+H).)+)"
+    for move, text in re.findall(cursor_moves, updates):
+        if move:
+            row, column = map(int, move.split(";"))
+            continue
+        for char in re.sub(r"\x1b\[[0-9;]*m", "", text):
+            screen[(row, column)] = char
+            column += 2 if east_asian_width(char) in ("W", "F") else 1
+    return screen
+
+
+def assert_screen_shows(screen: dict, view: View):
+    """The screen shows the View, with anything else on it blanked out"""
+    fresh_table = LiveTable()
+    fresh_table.add(view, row=1)
+    expected_screen = apply_to_screen({}, fresh_table.refresh())
+    assert {position: screen[position] for position in expected_screen} == (
+        expected_screen
+    )
+    leftovers = [
+        char for position, char in screen.items() if position not in expected_screen
+    ]
+    assert set(leftovers) <= {" "}
+
+
+def test_live_table_first_refresh_draws_everything():
+    """The first refresh draws every line of every View"""
+    hand = View([Card("A", "clubs"), Card("K", "hearts")])
+    table = LiveTable()
+    table.add(hand, row=3, column=5)
+    updates = table.refresh()
+    assert updates.count("H") >= 7
+    assert "\x1b[3;5H" in updates
+    assert "\x1b[9;5H" in updates
+    assert table.refresh() == ""
+
+
+def test_live_table_redraws_only_changes():
+    """Flipping a card redraws far less than the whole table"""
+    hand = View([Card("A", "clubs"), Card("K", "hearts", hidden=True)], spacing=-5)
+    table = LiveTable()
+    table.add(hand, row=1)
+    screen = apply_to_screen({}, table.refresh())
+    full_draw = table.redraw()
+
+    hand[1].hidden = False
+    updates = table.refresh()
+    assert 0 < len(updates) < len(full_draw)
+    assert_screen_shows(apply_to_screen(screen, updates), hand)
+
+
+def test_live_table_blanks_out_removed_cards():
+    """Cards taken out of a View are erased from the screen"""
+    hand = View([Card("A", "clubs"), Card("10", "hearts"), Card("K", "spades")])
+    table = LiveTable()
+    table.add(hand, row=1)
+    screen = apply_to_screen({}, table.refresh())
+    hand.pop()
+    assert_screen_shows(apply_to_screen(screen, table.refresh()), hand)
+
+    erased_screen = apply_to_screen(screen, table.remove(hand))
+    assert set(erased_screen.values()) == {" "}
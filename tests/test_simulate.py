@@ -0,0 +1,55 @@
+"""Test the simulation runner"""
+
+from terminal_playing_cards.simulate import iter_chunks, iter_simulation, simulate
+
+
+def two_card_total(deck):
+    """Value of the first two cards dealt from a deck"""
+    return deck.pop().value + deck.pop().value
+
+
+def test_simulation_results_cover_every_hand():
+    """Every hand is played and its result counted"""
+    results = simulate(two_card_total, 250, seed=1, max_workers=1, chunk_size=100)
+    assert sum(results.values()) == 250
+
+
+def test_simulation_streams_chunks():
+    """Results arrive one chunk at a time"""
+    chunks = list(
+        iter_simulation(two_card_total, 250, seed=1, max_workers=1, chunk_size=100)
+    )
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+
+def test_simulation_is_reproducible_across_workers():
+    """The same seed gives the same results in one or several processes"""
+    single_process = simulate(
+        two_card_total,
+        400,
+        specifications={"A": {"clubs": 1, "hearts": 1}, "K": {"clubs": 10}},
+        seed=7,
+        max_workers=1,
+        chunk_size=50,
+    )
+    worker_pool = simulate(
+        two_card_total,
+        400,
+        specifications={"A": {"clubs": 1, "hearts": 1}, "K": {"clubs": 10}},
+        seed=7,
+        max_workers=2,
+        chunk_size=50,
+    )
+    assert single_process == worker_pool
+    assert set(single_process) <= {2, 11}
+
+
+def test_chunks_arrive_in_order_from_workers():
+    """Chunks run in worker processes still come back in order"""
+    chunk_args = [(2, power) for power in range(10)]
+    results = iter_chunks(pow, chunk_args, max_workers=2)
+    assert list(results) == [2 ** power for power in range(10)]
+    # Closing the iterator early stops the pool without running the rest
+    results = iter_chunks(pow, chunk_args, max_workers=2)
+    assert next(results) == 1
+    results.close()
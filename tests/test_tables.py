@@ -0,0 +1,84 @@
+"""Test the cached poker rank tables"""
+# Disable this pylint rule because of a conflict with @pytest.fixture
+# See: stackoverflow.com/questions/46089480/pytest-fixtures-redefining-name-from-outer-scope-pylint
+# pylint: disable=redefined-outer-name
+
+import mmap
+from array import array
+import pytest
+from terminal_playing_cards.eval import HandEvaluator
+from terminal_playing_cards.tables import (
+    NO_HAND,
+    TABLES_VERSION,
+    PokerTables,
+    build_tables,
+    load_tables,
+)
+
+
+@pytest.fixture(scope="module")
+def tables_bytes():
+    """Poker rank tables, generated once for all tests"""
+    return build_tables()
+
+
+def test_tables_are_cached_and_memory_mapped(tmp_path, monkeypatch, tables_bytes):
+    """The tables are generated on the first load and mapped from disk after"""
+    import terminal_playing_cards.tables as tables_module
+
+    builds = []
+    monkeypatch.setattr(
+        tables_module, "build_tables", lambda: builds.append(1) or tables_bytes
+    )
+    cache_dir = str(tmp_path / "cache")
+    first_tables = load_tables(cache_dir)
+    load_tables.cache_clear()
+    second_tables = load_tables(cache_dir)
+    load_tables.cache_clear()
+    assert builds == [1]
+    assert isinstance(second_tables.buffer, mmap.mmap)
+    assert (tmp_path / "cache" / f"poker_ranks_v{TABLES_VERSION}.bin").exists()
+    assert list(first_tables.ranks) == list(second_tables.ranks)
+    assert len(second_tables.ranks) == 7462
+    assert len(second_tables.seven) == 7825760
+
+
+def test_broken_cache_files_are_rebuilt(tmp_path, tables_bytes):
+    """A truncated or outdated cache file is replaced with fresh tables"""
+    cache_file = tmp_path / f"poker_ranks_v{TABLES_VERSION}.bin"
+    cache_file.write_bytes(tables_bytes[:1000])
+    with pytest.raises(ValueError):
+        PokerTables(cache_file.read_bytes())
+    tables = load_tables(str(tmp_path))
+    load_tables.cache_clear()
+    assert len(tables.ranks) == 7462
+    assert cache_file.stat().st_size == len(tables_bytes)
+
+
+def test_tables_stay_in_memory_without_a_cache(tmp_path, monkeypatch, tables_bytes):
+    """Tables are still available when the cache cannot be written"""
+    import terminal_playing_cards.tables as tables_module
+
+    monkeypatch.setattr(tables_module, "build_tables", lambda: tables_bytes)
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    tables = load_tables(str(not_a_directory / "cache"))
+    load_tables.cache_clear()
+    assert tables.buffer is tables_bytes
+
+
+def test_rank_tables_cover_every_hand(tables_bytes):
+    """Every mix of ranks has an entry, and five of a kind has none"""
+    tables = PokerTables(tables_bytes)
+    assert tables.five.tolist().count(NO_HAND) == len(tables.five) - 6175
+    assert tables.seven.tolist().count(NO_HAND) == len(tables.seven) - 49205
+    assert len(tables.six) == 18395
+
+    evaluator = HandEvaluator()
+    hand = array("B", [0, 1, 2, 3, 4, 5])
+    assert evaluator.poker_ranks([hand], tables=tables) == evaluator.poker_ranks(
+        [hand]
+    )
+    five_aces = array("B", [0, 1, 2, 3, 0])
+    with pytest.raises(NotImplementedError):
+        evaluator.poker_ranks([five_aces], tables=tables)
@@ -158,6 +158,26 @@ def test_view_sort_by_value(five_card_view, five_card_view_sorted):
         assert five_card_view[card] == five_card_view_sorted[card]
 
 
+def test_view_sort_by_value_desc_with_any_comparable_values():
+    """Values only need to be comparable, not numbers, to sort descending"""
+    from terminal_playing_cards.card import Card
+
+    hand = View(
+        [
+            Card("A", "spades", value="ace"),
+            Card("K", "hearts", value="king"),
+            Card("A", "clubs", value="ace"),
+        ]
+    )
+    hand.sort(sort_order=["value"], value_order="desc")
+    # Cards with equal values keep their order
+    assert [(card.value, card.suit) for card in hand] == [
+        ("king", "hearts"),
+        ("ace", "spades"),
+        ("ace", "clubs"),
+    ]
+
+
 def test_view_sort_by_suit(five_card_view, five_card_view_sorted):
     """Sort by suit returns the correct order"""
     suit_order = ["hearts", "spades", "diamonds", "clubs"]
@@ -181,12 +201,12 @@ def test_view_sort_by_only_two_suit(five_card_view, five_card_view_sorted):
 
 def test_view_print_throws_good_error_message(two_card_view):
     """Alert the user that the orientation/spacing they asked for does not exist"""
+    two_card_view.orientation = "vertical"
     with pytest.raises(NotImplementedError):
-        two_card_view.orientation = "vertical"
-        print(two_card_view)
-    with pytest.raises(NotImplementedError):
-        two_card_view.spacing = -1
-        print(two_card_view)
+        two_card_view.spacing = -7
+    # The View is left as it was, so it still prints
+    assert two_card_view.spacing == 2
+    print(two_card_view)
 
 
 def test_view_setters_throws_good_error_message(two_card_view):
@@ -195,3 +215,211 @@ def test_view_setters_throws_good_error_message(two_card_view):
         two_card_view.orientation = "fake"
     with pytest.raises(NotImplementedError):
         two_card_view.spacing = -11
+    two_card_view.spacing = -8
+    with pytest.raises(NotImplementedError):
+        two_card_view.orientation = "vertical"
+    assert two_card_view.orientation == "horizontal"
+    with pytest.raises(NotImplementedError):
+        View(list(two_card_view), orientation="vertical", spacing=-7)
+
+
+def test_view_plans_each_card_once(monkeypatch):
+    """Printing a View renders each Card once, not once per layer"""
+    from terminal_playing_cards.card import Card
+
+    render_calls = []
+    original_render = Card._render
+
+    def counting_render(card):
+        render_calls.append(card)
+        return original_render(card)
+
+    monkeypatch.setattr(Card, "_render", counting_render)
+    view = View([Card("A", "clubs"), Card("10", "hearts"), Card("K", "spades")])
+    str(view)
+    assert len(render_calls) == 3
+
+
+def test_view_render_scales_linearly(assert_scales_linearly):
+    """Regression benchmark: rendering time grows linearly with hand size"""
+    from terminal_playing_cards.deck import Deck
+
+    def render_view(n_decks):
+        cards = []
+        for _ in range(n_decks):
+            cards += Deck().cards
+        view = View(cards, spacing=-5)
+        return lambda: str(view)
+
+    assert_scales_linearly(render_view, (2, 16), number=5)
+
+
+def test_view_sort_keeps_unlisted_suits_at_the_end():
+    """Suits missing from suit_order keep their order behind the listed suits"""
+    from terminal_playing_cards.card import Card
+
+    view = View(
+        [
+            Card("2", "clubs", value=2),
+            Card("2", "diamonds", value=2),
+            Card("3", "hearts", value=3),
+            Card("2", "hearts", value=2),
+        ]
+    )
+    view.sort(sort_order=["suit"], suit_order=["diamonds"])
+    assert [(card.face, card.suit) for card in view] == [
+        ("2", "diamonds"),
+        ("2", "clubs"),
+        ("3", "hearts"),
+        ("2", "hearts"),
+    ]
+
+
+def test_view_sort_with_custom_key(five_card_view):
+    """A custom key function overrides the built-in sort stages"""
+    five_card_view.sort(key=lambda card: card.face)
+    assert [card.face for card in five_card_view] == ["2", "2", "A", "J", "K", "Q"]
+
+
+def test_view_iter_lines(messy_view):
+    """Iterating over lines gives the same lines as printing the View"""
+    printed_lines = str(messy_view).split("\n")[1:]
+    lines = messy_view.iter_lines()
+    assert next(lines) == printed_lines[0]
+    assert list(lines) == printed_lines[1:]
+
+
+def test_view_render_to_stream(messy_view):
+    """Rendering to a stream writes what print would, in bounded writes"""
+    from io import StringIO
+
+    printed = StringIO()
+    print(messy_view, file=printed)
+
+    writes = []
+
+    class RecordingStream(StringIO):
+        def write(self, text):
+            writes.append(text)
+            return super().write(text)
+
+    rendered = RecordingStream()
+    messy_view.render_to(rendered, buffer_size=100)
+    assert rendered.getvalue() == printed.getvalue()
+    assert len(writes) > 1
+
+
+def test_view_render_backends(two_card_view_negative_spacing):
+    """Backends render the same cards with full, fewer or no escapes"""
+    view = two_card_view_negative_spacing
+    assert view.render("ansi") == str(view)
+    assert view.render("plain") == (
+        "\n"
+        "A      |Q          \n"
+        "♣      |♥          \n"
+        "       |           \n"
+        "     ♣ |     ♛     \n"
+        "       |           \n"
+        "       |          ♥\n"
+        "       |          Q"
+    )
+    # Neighboring cards of the same color share their escape codes
+    from terminal_playing_cards.card import Card
+
+    same_color_view = View([Card("A", "clubs"), Card("K", "spades")], spacing=-5)
+    assert same_color_view.render("minimal").split("\n")[1] == (
+        "\x1b[30;47mA      |K          \x1b[0m"
+    )
+    assert view.render("minimal").split("\n")[1] == (
+        "\x1b[30;47mA      |\x1b[31mQ          \x1b[0m"
+    )
+
+
+def test_view_unknown_backend_throws_good_error_message(two_card_view):
+    """Alert the user that the backend they asked for does not exist"""
+    with pytest.raises(NotImplementedError):
+        two_card_view.render("fake")
+
+
+def test_minimal_backend_emits_only_style_changes():
+    """Escapes in a large View are written only where the style changes"""
+    from terminal_playing_cards.deck import Deck
+
+    view = View(Deck().cards, spacing=-5)
+    view.sort(sort_order=["suit"])
+    # Per line: one escape for all the clubs and spades, since the black
+    # borders match them, one to and from red around each diamond and heart
+    # card, and the final reset. Every card and border has its own otherwise
+    for line in view.render("minimal").split("\n")[1:]:
+        assert line.count("\x1b[") == 1 + 26 + 25 + 1
+    for line in str(view).split("\n")[1:]:
+        assert line.count("\x1b[") == 52 * 2 + 51 + 1
+    assert len(view.render("minimal")) < 0.6 * len(str(view))
+
+
+def test_view_render_async(messy_view):
+    """Rendering within an event loop gives the same text"""
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    async def render_with_other_task():
+        ticks = []
+
+        async def other_table():
+            for tick in range(3):
+                ticks.append(tick)
+                await asyncio.sleep(0)
+
+        other_task = asyncio.ensure_future(other_table())
+        rendered = await messy_view.render_async()
+        await other_task
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offloaded = await messy_view.render_async("plain", executor=executor)
+        return rendered, offloaded, ticks
+
+    loop = asyncio.new_event_loop()
+    rendered, offloaded, ticks = loop.run_until_complete(render_with_other_task())
+    loop.close()
+    assert rendered == str(messy_view)
+    assert offloaded == messy_view.render("plain")
+    assert ticks == [0, 1, 2]
+
+
+def test_view_can_be_pickled(messy_view):
+    """Views can be sent to other processes, e.g. to render them there"""
+    import pickle
+
+    assert str(pickle.loads(pickle.dumps(messy_view))) == str(messy_view)
+
+
+def test_vertical_view_stacks_cards():
+    """A vertical View stacks the cards, overlapping them with negative spacing"""
+    from terminal_playing_cards.card import Card
+
+    cards = [Card("10", "hearts"), Card("K", "spades"), Card("A", "clubs")]
+    card_lines = [card.render("plain").split("\n")[1:] for card in cards]
+    view = View(cards, orientation="vertical", spacing=1)
+    assert view.render("plain").split("\n")[1:] == (
+        card_lines[0] + [""] + card_lines[1] + [""] + card_lines[2]
+    )
+    view.spacing = -4
+    assert view.render("plain").split("\n")[1:] == (
+        card_lines[0][:3] + card_lines[1][:3] + card_lines[2]
+    )
+    view.spacing = -6
+    assert len(list(view.iter_lines())) == 1 + 1 + 7
+    single_card = View([cards[0]], orientation="vertical")
+    assert single_card.render("plain") == cards[0].render("plain")
+
+
+def test_vertical_render_is_as_fast_as_horizontal():
+    """Regression benchmark: a vertical column renders as fast as a row"""
+    from timeit import repeat
+    from terminal_playing_cards.deck import Deck
+
+    cards = Deck().cards
+    row = View(cards, spacing=-5)
+    column = View(cards, orientation="vertical", spacing=-5)
+    row_time = min(repeat(lambda: str(row), number=20, repeat=5))
+    column_time = min(repeat(lambda: str(column), number=20, repeat=5))
+    assert column_time < 2 * row_time